@@ -3,9 +3,10 @@ Minimal Wayback Machine connector.
 Uses CDX API and archived snapshots. Metrics are contextual signals only.
 """
 
+import asyncio
 import re
 import time
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, TypeVar
 
 import httpx
 
@@ -43,16 +44,12 @@ def _parse_number(s: str) -> int:
         return 0
 
 
-def list_snapshots(
+def _cdx_params(
     url: str,
     from_year: Optional[int] = None,
     to_year: Optional[int] = None,
     limit: int = 200,
-) -> list[dict]:
-    """
-    Use Wayback CDX API to return snapshot timestamps + original URL.
-    Returns list of {"timestamp": "...", "original": "..."}.
-    """
+) -> dict:
     params = {
         "url": url,
         "output": "json",
@@ -65,11 +62,10 @@ def list_snapshots(
         params["from"] = str(from_year)
     if to_year is not None:
         params["to"] = str(to_year)
+    return params
 
-    with httpx.Client(timeout=15.0, headers=WAYBACK_HEADERS) as client:
-        resp = client.get(CDX_URL, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+
+def _parse_cdx(data: list) -> list[dict]:
     if not data or len(data) < 2:
         return []
 
@@ -84,6 +80,38 @@ def list_snapshots(
     ]
 
 
+def list_snapshots(
+    url: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    limit: int = 200,
+) -> list[dict]:
+    """
+    Use Wayback CDX API to return snapshot timestamps + original URL.
+    Returns list of {"timestamp": "...", "original": "..."}.
+    """
+    with httpx.Client(timeout=15.0, headers=WAYBACK_HEADERS) as client:
+        resp = client.get(CDX_URL, params=_cdx_params(url, from_year, to_year, limit))
+        resp.raise_for_status()
+        data = resp.json()
+    return _parse_cdx(data)
+
+
+async def alist_snapshots(
+    client: httpx.AsyncClient,
+    url: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    limit: int = 200,
+) -> list[dict]:
+    """Async list_snapshots on a shared client."""
+    resp = await client.get(
+        CDX_URL, params=_cdx_params(url, from_year, to_year, limit), headers=WAYBACK_HEADERS, timeout=15.0
+    )
+    resp.raise_for_status()
+    return _parse_cdx(resp.json())
+
+
 def fetch_snapshot_html(timestamp: str, url: str) -> Optional[str]:
     """Fetch HTML from archived URL. Returns None on failure."""
     archived = f"https://web.archive.org/web/{timestamp}/{url}"
@@ -96,6 +124,17 @@ def fetch_snapshot_html(timestamp: str, url: str) -> Optional[str]:
         return None
 
 
+async def afetch_snapshot_html(client: httpx.AsyncClient, timestamp: str, url: str) -> Optional[str]:
+    """Async fetch_snapshot_html on a shared client. Returns None on failure."""
+    archived = f"https://web.archive.org/web/{timestamp}/{url}"
+    try:
+        resp = await client.get(archived, headers=WAYBACK_HEADERS, timeout=FETCH_TIMEOUT)
+        resp.raise_for_status()
+        return resp.text
+    except Exception:
+        return None
+
+
 def extract_metric(
     html: str,
     platform_hint: Optional[str] = None,
@@ -139,6 +178,28 @@ def extract_metric(
     return best
 
 
+NOTES = "Sparse archival snapshots; coverage varies. Metrics are contextual signals only."
+
+
+def _sample_evenly(snapshots_raw: list[dict], sample: int) -> list[dict]:
+    n = min(sample, len(snapshots_raw))
+    step = max(1, len(snapshots_raw) // n)
+    indices = [i * step for i in range(n)][:n]
+    return [snapshots_raw[i] for i in indices if i < len(snapshots_raw)]
+
+
+def _snapshot_entry(s: dict, html: Optional[str]) -> dict:
+    entry = {
+        "timestamp": s["timestamp"],
+        "archived_url": f"https://web.archive.org/web/{s['timestamp']}/{s['original']}",
+    }
+    if html:
+        metric = extract_metric(html)
+        if metric:
+            entry.update(metric)
+    return entry
+
+
 def get_snapshots_with_metrics(
     url: str,
     from_year: Optional[int] = None,
@@ -151,35 +212,58 @@ def get_snapshots_with_metrics(
     """
     snapshots_raw = list_snapshots(url, from_year, to_year, limit=500)
     if not snapshots_raw:
-        return {
-            "url": url,
-            "snapshots": [],
-            "notes": "Sparse archival snapshots; coverage varies. Metrics are contextual signals only.",
-        }
-
-    # Sample evenly across time
-    n = min(sample, len(snapshots_raw))
-    step = max(1, len(snapshots_raw) // n)
-    indices = [i * step for i in range(n)][:n]
-    sampled = [snapshots_raw[i] for i in indices if i < len(snapshots_raw)]
+        return {"url": url, "snapshots": [], "notes": NOTES}
 
     results = []
-    for i, s in enumerate(sampled):
+    for i, s in enumerate(_sample_evenly(snapshots_raw, sample)):
         if i > 0:
             time.sleep(REQUEST_DELAY_MS / 1000.0)
         html = fetch_snapshot_html(s["timestamp"], s["original"])
-        entry = {
-            "timestamp": s["timestamp"],
-            "archived_url": f"https://web.archive.org/web/{s['timestamp']}/{s['original']}",
-        }
-        if html:
-            metric = extract_metric(html)
-            if metric:
-                entry.update(metric)
-        results.append(entry)
-
-    return {
-        "url": url,
-        "snapshots": results,
-        "notes": "Sparse archival snapshots; coverage varies. Metrics are contextual signals only.",
-    }
+        results.append(_snapshot_entry(s, html))
+
+    return {"url": url, "snapshots": results, "notes": NOTES}
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def apaced_map(fn: Callable[[T], Awaitable[R]], items: Iterable[T], interval: float) -> AsyncIterator[R]:
+    """
+    Yield fn(item) results in order, starting call i at i * interval seconds. Starts keep the
+    Archive pacing, but a slow response no longer delays the next request. Pending calls are
+    canceled if the consumer stops early.
+    """
+
+    async def run(i: int, item: T) -> R:
+        await asyncio.sleep(i * interval)
+        return await fn(item)
+
+    tasks = [asyncio.create_task(run(i, item)) for i, item in enumerate(items)]
+    try:
+        for t in tasks:
+            yield await t
+    finally:
+        for t in tasks:
+            t.cancel()
+
+
+async def aget_snapshots_with_metrics(
+    client: httpx.AsyncClient,
+    url: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    sample: int = 30,
+) -> dict:
+    """Async get_snapshots_with_metrics on a shared client; same start pacing, fetches overlap, extraction off the event loop."""
+    snapshots_raw = await alist_snapshots(client, url, from_year, to_year, limit=500)
+    if not snapshots_raw:
+        return {"url": url, "snapshots": [], "notes": NOTES}
+
+    async def one(s: dict) -> dict:
+        html = await afetch_snapshot_html(client, s["timestamp"], s["original"])
+        return await asyncio.to_thread(_snapshot_entry, s, html)
+
+    sampled = _sample_evenly(snapshots_raw, sample)
+    results = [r async for r in apaced_map(one, sampled, REQUEST_DELAY_MS / 1000.0)]
+    return {"url": url, "snapshots": results, "notes": NOTES}
@@ -4,13 +4,17 @@ Only accesses Wayback public endpoints. No live scraping.
 Conservative extraction: false positives worse than missing.
 """
 
+import asyncio
 import re
+import threading
 import time
 from html import unescape
-from typing import Optional, Tuple
+from typing import AsyncIterator, Optional, Tuple
 
 import httpx
 
+from connectors.wayback import apaced_map
+
 CDX_URL = "https://web.archive.org/cdx/search/cdx"
 FETCH_TIMEOUT = 15.0
 # Internet Archive: 15 req/min limit (archive.org/details/toomanyrequests_20191110)
@@ -20,6 +24,9 @@ WAYBACK_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; SignalMap/1.0; research tool)",
 }
 EVIDENCE_MAX_LEN = 140
+CDX_MIN_GAP_S = 0.5  # minimum spacing between CDX request starts (sync and async, across threads)
+_next_cdx_start = 0.0
+_cdx_lock = threading.Lock()  # held only to reserve a slot, never across a sleep or await
 
 
 def _parse_number(s: str) -> float:
@@ -74,7 +81,7 @@ def _build_archived_url(timestamp: str, original_url: str) -> str:
     return f"https://web.archive.org/web/{timestamp}/{original_url}"
 
 
-def _fetch_cdx(
+def _cdx_params(
     url: str,
     from_year: Optional[int] = None,
     to_year: Optional[int] = None,
@@ -82,8 +89,8 @@ def _fetch_cdx(
     to_date: Optional[str] = None,
     limit: int = 500,
     match_type: Optional[str] = None,
-) -> list[dict]:
-    """Fetch CDX results for a URL. Use from_date/to_date (YYYYMMDD) for precise ranges, else from_year/to_year."""
+) -> list[tuple]:
+    """CDX query params. Use from_date/to_date (YYYYMMDD) for precise ranges, else from_year/to_year."""
     params_list = [
         ("url", url),
         ("output", "json"),
@@ -103,16 +110,11 @@ def _fetch_cdx(
         params_list.append(("to", to_date))
     elif to_year is not None:
         params_list.append(("to", str(to_year)))
+    return params_list
 
-    time.sleep(0.5)  # Be polite to CDX; reduces 429 risk
-    with httpx.Client(timeout=15.0, headers=WAYBACK_HEADERS) as client:
-        resp = client.get(CDX_URL, params=params_list)
-        if resp.status_code == 429:
-            time.sleep(8.0)
-            resp = client.get(CDX_URL, params=params_list)
-        resp.raise_for_status()
-        data = resp.json()
 
+def _parse_cdx(data: list) -> list[dict]:
+    """CDX JSON rows (header row first) to [{"timestamp", "original"}]."""
     if not data or len(data) < 2:
         return []
 
@@ -127,6 +129,62 @@ def _fetch_cdx(
     ]
 
 
+def _reserve_cdx_start() -> float:
+    """Reserve the next CDX start slot, CDX_MIN_GAP_S after the previous one; returns seconds to wait."""
+    global _next_cdx_start
+    with _cdx_lock:
+        now = time.monotonic()
+        start = max(now, _next_cdx_start)
+        _next_cdx_start = start + CDX_MIN_GAP_S
+    return start - now
+
+
+def _fetch_cdx(
+    url: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    limit: int = 500,
+    match_type: Optional[str] = None,
+) -> list[dict]:
+    """Fetch CDX results for a URL. Use from_date/to_date (YYYYMMDD) for precise ranges, else from_year/to_year."""
+    params_list = _cdx_params(url, from_year, to_year, from_date, to_date, limit, match_type)
+
+    time.sleep(_reserve_cdx_start())  # Be polite to CDX; reduces 429 risk
+    with httpx.Client(timeout=15.0, headers=WAYBACK_HEADERS) as client:
+        resp = client.get(CDX_URL, params=params_list)
+        if resp.status_code == 429:
+            time.sleep(8.0 + _reserve_cdx_start())
+            resp = client.get(CDX_URL, params=params_list)
+        resp.raise_for_status()
+        return _parse_cdx(resp.json())
+
+
+async def _afetch_cdx(
+    client: httpx.AsyncClient,
+    url: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    limit: int = 500,
+    match_type: Optional[str] = None,
+) -> list[dict]:
+    """Async _fetch_cdx on a shared client."""
+    params_list = _cdx_params(url, from_year, to_year, from_date, to_date, limit, match_type)
+
+    # Concurrent variants (alist_snapshots) each get their own start slot, so they go out spaced, not as a burst
+    await asyncio.sleep(_reserve_cdx_start())
+    resp = await client.get(CDX_URL, params=params_list, headers=WAYBACK_HEADERS, timeout=15.0)
+    if resp.status_code == 429:
+        await asyncio.sleep(8.0)
+        await asyncio.sleep(_reserve_cdx_start())  # retries are spaced too
+        resp = await client.get(CDX_URL, params=params_list, headers=WAYBACK_HEADERS, timeout=15.0)
+    resp.raise_for_status()
+    return _parse_cdx(resp.json())
+
+
 def _is_profile_url(original: str, username: str) -> bool:
     """True if URL is the profile page (not /username/photos, etc)."""
     if not original or not username:
@@ -142,6 +200,54 @@ def _is_profile_url(original: str, username: str) -> bool:
     return len(parts) == 1 and parts[0].lower() == username.lower()
 
 
+def _profile_base(url: str) -> str:
+    """Username path segment of an Instagram profile URL, or "" if not one."""
+    if "instagram.com/" not in url:
+        return ""
+    return url.split("instagram.com/")[-1].split("?")[0].strip().rstrip("/")
+
+
+def _primary_cdx_variants(base: str) -> list[Tuple[str, Optional[str]]]:
+    """URL forms to query, with CDX matchType; instagram.com:80 first (older archives often use this)."""
+    return [
+        (f"instagram.com:80/{base}", "prefix"),
+        (f"instagram.com/{base}/", "prefix"),
+        (f"http://instagram.com:80/{base}", None),
+        (f"https://www.instagram.com/{base}/", None),
+    ]
+
+
+def _fallback_cdx_variants(base: str, url: str) -> list[str]:
+    """Alternate URL forms tried in order when the primary variants return nothing."""
+    return [
+        u
+        for u in (
+            f"https://instagram.com/{base}/",
+            f"https://www.instagram.com/{base}",
+            f"http://instagram.com/{base}",
+            f"http://www.instagram.com/{base}/",
+        )
+        if u != url and u.rstrip("/") != url.rstrip("/")
+    ]
+
+
+def _merge_snapshots(
+    all_snapshots: list[dict],
+    seen_ts: set[str],
+    snaps: list[dict],
+    base: str,
+    match_type: Optional[str] = None,
+) -> None:
+    """Append snaps not already seen by timestamp; prefix matches are narrowed to the profile page."""
+    if match_type == "prefix":
+        filtered = [s for s in snaps if _is_profile_url(s["original"], base)]
+        snaps = filtered if filtered else snaps
+    for s in snaps:
+        if s["timestamp"] not in seen_ts:
+            seen_ts.add(s["timestamp"])
+            all_snapshots.append(s)
+
+
 def list_snapshots(
     url: str,
     from_year: Optional[int] = None,
@@ -155,55 +261,74 @@ def list_snapshots(
     Pass from_date/to_date (YYYYMMDD) for precise ranges (e.g. past two weeks).
     Otherwise use from_year/to_year.
     """
-    if "instagram.com/" not in url:
-        return []
-
-    base = url.split("instagram.com/")[-1].split("?")[0].strip().rstrip("/")
+    base = _profile_base(url)
     if not base:
         return []
 
-    all_snapshots = []
+    all_snapshots: list[dict] = []
     url = url.strip()
     seen_ts: set[str] = set()
 
-    # Try URL forms; put instagram.com:80 first (older archives often use this)
-    urls_to_try = [
-        (f"instagram.com:80/{base}", "prefix"),
-        (f"instagram.com/{base}/", "prefix"),
-        (f"http://instagram.com:80/{base}", None),
-        (f"https://www.instagram.com/{base}/", None),
-    ]
-    for u, match_type in urls_to_try:
+    for u, match_type in _primary_cdx_variants(base):
         try:
             snaps = _fetch_cdx(u, from_year=from_year, to_year=to_year, from_date=from_date, to_date=to_date, limit=limit, match_type=match_type)
-            if snaps:
-                if match_type == "prefix":
-                    filtered = [s for s in snaps if _is_profile_url(s["original"], base)]
-                    snaps = filtered if filtered else snaps
-                for s in snaps:
-                    if s["timestamp"] not in seen_ts:
-                        seen_ts.add(s["timestamp"])
-                        all_snapshots.append(s)
+            _merge_snapshots(all_snapshots, seen_ts, snaps, base, match_type)
         except Exception:
             continue
 
     # Fallback: try alternate URL forms if still empty
     if not all_snapshots:
-        for u in [
-            f"https://instagram.com/{base}/",
-            f"https://www.instagram.com/{base}",
-            f"http://instagram.com/{base}",
-            f"http://www.instagram.com/{base}/",
-        ]:
-            if u == url or u.rstrip("/") == url.rstrip("/"):
-                continue
+        for u in _fallback_cdx_variants(base, url):
             try:
                 snaps = _fetch_cdx(u, from_year=from_year, to_year=to_year, from_date=from_date, to_date=to_date, limit=limit)
                 if snaps:
-                    for s in snaps:
-                        if s["timestamp"] not in seen_ts:
-                            seen_ts.add(s["timestamp"])
-                            all_snapshots.append(s)
+                    _merge_snapshots(all_snapshots, seen_ts, snaps, base)
+                    break
+            except Exception:
+                continue
+
+    return all_snapshots
+
+
+async def alist_snapshots(
+    client: httpx.AsyncClient,
+    url: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    limit: int = 500,
+) -> list[dict]:
+    """
+    Async list_snapshots: primary URL variants are queried concurrently, merged in the same order.
+    Request starts still go out CDX_MIN_GAP_S apart (see _reserve_cdx_start); only the round trips overlap.
+    """
+    base = _profile_base(url)
+    if not base:
+        return []
+
+    all_snapshots: list[dict] = []
+    url = url.strip()
+    seen_ts: set[str] = set()
+
+    variants = _primary_cdx_variants(base)
+    fetched = await asyncio.gather(
+        *(
+            _afetch_cdx(client, u, from_year=from_year, to_year=to_year, from_date=from_date, to_date=to_date, limit=limit, match_type=match_type)
+            for u, match_type in variants
+        ),
+        return_exceptions=True,
+    )
+    for (_, match_type), snaps in zip(variants, fetched):
+        if not isinstance(snaps, BaseException):
+            _merge_snapshots(all_snapshots, seen_ts, snaps, base, match_type)
+
+    if not all_snapshots:
+        for u in _fallback_cdx_variants(base, url):
+            try:
+                snaps = await _afetch_cdx(client, u, from_year=from_year, to_year=to_year, from_date=from_date, to_date=to_date, limit=limit)
+                if snaps:
+                    _merge_snapshots(all_snapshots, seen_ts, snaps, base)
                     break
             except Exception:
                 continue
@@ -261,16 +386,20 @@ def evenly_sample_snapshots(
     return sorted(result, key=lambda s: s["timestamp"])
 
 
-def fetch_snapshot_html(timestamp: str, original_url: str) -> Tuple[Optional[str], str]:
+def fetch_snapshot_html(
+    timestamp: str, original_url: str, delay: float = REQUEST_DELAY_S
+) -> Tuple[Optional[str], str]:
     """
     Fetch HTML from archived URL.
     Returns (html, archived_url). html is None on failure.
     Retries once with longer delay on 429.
+    Sleeps ``delay`` before each attempt; callers that pace requests themselves pass 0.
     """
     archived_url = _build_archived_url(timestamp, original_url)
     for attempt in range(2):
         try:
-            time.sleep(REQUEST_DELAY_S)
+            if delay:
+                time.sleep(delay)
             with httpx.Client(timeout=FETCH_TIMEOUT, headers=WAYBACK_HEADERS) as client:
                 resp = client.get(archived_url)
                 if resp.status_code == 429:
@@ -288,6 +417,30 @@ def fetch_snapshot_html(timestamp: str, original_url: str) -> Tuple[Optional[str
     return None, archived_url
 
 
+async def afetch_snapshot_html(
+    client: httpx.AsyncClient, timestamp: str, original_url: str
+) -> Tuple[Optional[str], str]:
+    """Async fetch_snapshot_html on a shared client; same delay and 429 retry."""
+    archived_url = _build_archived_url(timestamp, original_url)
+    for attempt in range(2):
+        try:
+            await asyncio.sleep(REQUEST_DELAY_S)
+            resp = await client.get(archived_url, headers=WAYBACK_HEADERS, timeout=FETCH_TIMEOUT)
+            if resp.status_code == 429:
+                await asyncio.sleep(5.0)  # Back off before retry
+                continue
+            resp.raise_for_status()
+            return resp.text, archived_url
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429 and attempt == 0:
+                await asyncio.sleep(5.0)
+                continue
+            return None, archived_url
+        except Exception:
+            return None, archived_url
+    return None, archived_url
+
+
 def _extract_from_shared_data(html: str) -> Optional[dict]:
     """
     Strategy: window._sharedData has ProfilePage with followed_by, follows, media counts.
@@ -516,6 +669,83 @@ def extract_instagram_metrics(html: str) -> dict:
     return result
 
 
+def _snapshot_entry(s: dict, html: Optional[str], include_evidence: bool = True) -> dict:
+    """Result row for one sampled snapshot; metrics are None when html is missing or yields nothing."""
+    original_url = s["original"]
+    entry = {
+        "timestamp": s["timestamp"],
+        "original_url": original_url,
+        "archived_url": _build_archived_url(s["timestamp"], original_url),
+    }
+
+    if html:
+        metrics = extract_instagram_metrics(html)
+        f = metrics["followers"]["value"]
+        g = metrics["following"]["value"]
+        p = metrics["posts"]["value"]
+        if f is not None or g is not None or p is not None:
+            entry["followers"] = f
+            entry["following"] = g
+            entry["posts"] = p
+            confs = [m["confidence"] for m in metrics.values() if m["value"] is not None]
+            entry["confidence"] = round(max(confs, default=0), 2) if confs else 0.2
+            ev = next((m["evidence"] for m in metrics.values() if m["evidence"]), None)
+            entry["evidence"] = (ev[:EVIDENCE_MAX_LEN] if ev else None) if include_evidence else None
+        else:
+            entry["followers"] = None
+            entry["following"] = None
+            entry["posts"] = None
+            entry["confidence"] = 0.2
+            entry["evidence"] = None
+    else:
+        entry["followers"] = None
+        entry["following"] = None
+        entry["posts"] = None
+        entry["confidence"] = 0.0
+        entry["evidence"] = None
+    return entry
+
+
+def _empty_username_response() -> dict:
+    return {
+        "platform": "instagram",
+        "username": "",
+        "canonical_url": "https://www.instagram.com/",
+        "snapshots_total": 0,
+        "snapshots_sampled": 0,
+        "results": [],
+        "notes": "Username is required.",
+    }
+
+
+def _archival_notes(snapshots_total: int) -> str:
+    notes = "Sparse archival snapshots; missing metrics are expected. Treat as contextual signals only."
+    if snapshots_total == 0:
+        notes += " No snapshots found for this profile in the archive—the username may have no historic captures, or the Wayback CDX service may be unreachable."
+    return notes
+
+
+def _archival_response(
+    username: str,
+    canonical_url: str,
+    snapshots_total: int,
+    results: list[dict],
+    progress: bool = False,
+) -> dict:
+    out = {
+        "platform": "instagram",
+        "username": username,
+        "canonical_url": canonical_url,
+        "snapshots_total": snapshots_total,
+        "snapshots_sampled": len(results),
+        "results": results,
+        "notes": _archival_notes(snapshots_total),
+    }
+    if progress:
+        out["progress"] = {"total": len(results), "processed": len(results)}
+    return out
+
+
 def get_instagram_archival_metrics(
     username: str,
     from_year: Optional[int] = None,
@@ -532,15 +762,7 @@ def get_instagram_archival_metrics(
     """
     username = (username or "").strip()
     if not username:
-        return {
-            "platform": "instagram",
-            "username": "",
-            "canonical_url": "https://www.instagram.com/",
-            "snapshots_total": 0,
-            "snapshots_sampled": 0,
-            "results": [],
-            "notes": "Username is required.",
-        }
+        return _empty_username_response()
     canonical_url = f"https://www.instagram.com/{username}/"
     raw_snapshots = list_snapshots(
         canonical_url,
@@ -550,101 +772,96 @@ def get_instagram_archival_metrics(
         to_date=to_date,
         limit=500,
     )
-    snapshots_total = len(raw_snapshots)
-
-    deduped = deduplicate_snapshots(raw_snapshots)
-    sampled = evenly_sample_snapshots(deduped, sample)
-    snapshots_sampled = len(sampled)
+    sampled = evenly_sample_snapshots(deduplicate_snapshots(raw_snapshots), sample)
 
     results = []
-    processed = 0
-    total_to_process = len(sampled)
     for s in sampled:
-        original_url = s["original"]
-        archived_url = _build_archived_url(s["timestamp"], original_url)
-
         try:
-            html, _ = fetch_snapshot_html(s["timestamp"], original_url)
+            html, _ = fetch_snapshot_html(s["timestamp"], s["original"])
         except Exception:
             html = None
+        results.append(_snapshot_entry(s, html, include_evidence))
 
-        processed += 1
-
-        entry = {
-            "timestamp": s["timestamp"],
-            "original_url": original_url,
-            "archived_url": archived_url,
-        }
-
-        if html:
-            metrics = extract_instagram_metrics(html)
-            f = metrics["followers"]["value"]
-            g = metrics["following"]["value"]
-            p = metrics["posts"]["value"]
-            if f is not None or g is not None or p is not None:
-                entry["followers"] = f
-                entry["following"] = g
-                entry["posts"] = p
-                confs = [m["confidence"] for m in metrics.values() if m["value"] is not None]
-                entry["confidence"] = round(max(confs, default=0), 2) if confs else 0.2
-                ev = next((m["evidence"] for m in metrics.values() if m["evidence"]), None)
-                entry["evidence"] = (ev[:EVIDENCE_MAX_LEN] if ev else None) if include_evidence else None
-            else:
-                entry["followers"] = None
-                entry["following"] = None
-                entry["posts"] = None
-                entry["confidence"] = 0.2
-                entry["evidence"] = None
-        else:
-            entry["followers"] = None
-            entry["following"] = None
-            entry["posts"] = None
-            entry["confidence"] = 0.0
-            entry["evidence"] = None
-
-        results.append(entry)
+    return _archival_response(username, canonical_url, len(raw_snapshots), results, progress)
 
-    notes = "Sparse archival snapshots; missing metrics are expected. Treat as contextual signals only."
-    if snapshots_total == 0:
-        notes += " No snapshots found for this profile in the archive—the username may have no historic captures, or the Wayback CDX service may be unreachable."
 
-    out = {
+async def aiter_instagram_archival_metrics(
+    client: httpx.AsyncClient,
+    username: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    sample: int = 30,
+    include_evidence: bool = True,
+) -> AsyncIterator[dict]:
+    """
+    Yield a header record (platform, username, canonical_url, snapshots_total, snapshots_sampled, notes),
+    then one result row per sampled snapshot as soon as it is fetched. username must be non-empty.
+    Snapshot fetches start REQUEST_DELAY_S apart but may overlap; extraction runs off the event loop.
+    """
+    username = username.strip()
+    canonical_url = f"https://www.instagram.com/{username}/"
+    raw_snapshots = await alist_snapshots(
+        client,
+        canonical_url,
+        from_year=from_year,
+        to_year=to_year,
+        from_date=from_date,
+        to_date=to_date,
+        limit=500,
+    )
+    sampled = evenly_sample_snapshots(deduplicate_snapshots(raw_snapshots), sample)
+    yield {
         "platform": "instagram",
         "username": username,
         "canonical_url": canonical_url,
-        "snapshots_total": snapshots_total,
-        "snapshots_sampled": snapshots_sampled,
-        "results": results,
-        "notes": notes,
+        "snapshots_total": len(raw_snapshots),
+        "snapshots_sampled": len(sampled),
+        "notes": _archival_notes(len(raw_snapshots)),
     }
-    if progress:
-        out["progress"] = {"total": total_to_process, "processed": processed}
-    return out
 
+    async def one(s: dict) -> dict:
+        html, _ = await afetch_snapshot_html(client, s["timestamp"], s["original"])
+        return await asyncio.to_thread(_snapshot_entry, s, html, include_evidence)
 
-def get_instagram_followers_time_series(
+    # afetch_snapshot_html sleeps REQUEST_DELAY_S itself, so request i still goes out at (i + 1) * delay
+    async for row in apaced_map(one, sampled, REQUEST_DELAY_S):
+        yield row
+
+
+async def aget_instagram_archival_metrics(
+    client: httpx.AsyncClient,
     username: str,
     from_year: Optional[int] = None,
     to_year: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     sample: int = 30,
+    include_evidence: bool = True,
+    progress: bool = False,
 ) -> dict:
-    """
-    Return a time series of follower counts from Wayback snapshots.
-    Only includes points where followers was successfully extracted.
-    Points sorted by date ascending.
-    """
-    data = get_instagram_archival_metrics(
-        username=username,
+    """Async get_instagram_archival_metrics on a shared client (collects aiter_instagram_archival_metrics)."""
+    username = (username or "").strip()
+    if not username:
+        return _empty_username_response()
+    rows = aiter_instagram_archival_metrics(
+        client,
+        username,
         from_year=from_year,
         to_year=to_year,
         from_date=from_date,
         to_date=to_date,
         sample=sample,
-        include_evidence=False,
-        progress=False,
+        include_evidence=include_evidence,
     )
+    header = await anext(rows)
+    results = [r async for r in rows]
+    return _archival_response(username, header["canonical_url"], header["snapshots_total"], results, progress)
+
+
+def _followers_series(data: dict, username: str) -> dict:
+    """Follower points (non-null, date ascending) from an archival metrics payload."""
     points = []
     for r in data.get("results", []):
         f = r.get("followers")
@@ -668,3 +885,53 @@ def get_instagram_followers_time_series(
         "points": points,
         "notes": "Sparse archival snapshots; missing points are expected. Interpret as contextual signals only.",
     }
+
+
+def get_instagram_followers_time_series(
+    username: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    sample: int = 30,
+) -> dict:
+    """
+    Return a time series of follower counts from Wayback snapshots.
+    Only includes points where followers was successfully extracted.
+    Points sorted by date ascending.
+    """
+    data = get_instagram_archival_metrics(
+        username=username,
+        from_year=from_year,
+        to_year=to_year,
+        from_date=from_date,
+        to_date=to_date,
+        sample=sample,
+        include_evidence=False,
+        progress=False,
+    )
+    return _followers_series(data, username)
+
+
+async def aget_instagram_followers_time_series(
+    client: httpx.AsyncClient,
+    username: str,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    sample: int = 30,
+) -> dict:
+    """Async get_instagram_followers_time_series on a shared client."""
+    data = await aget_instagram_archival_metrics(
+        client,
+        username=username,
+        from_year=from_year,
+        to_year=to_year,
+        from_date=from_date,
+        to_date=to_date,
+        sample=sample,
+        include_evidence=False,
+        progress=False,
+    )
+    return _followers_series(data, username)
@@ -5,6 +5,8 @@ Tables created idempotently on startup when DATABASE_URL is set.
 
 import json
 import os
+import threading
+import time
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Generator, Optional
@@ -12,12 +14,20 @@ from zoneinfo import ZoneInfo
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
 _raw = os.getenv("DATABASE_URL")
 # psycopg2 expects postgresql://; Railway may provide postgres://
 DATABASE_URL = _raw.replace("postgres://", "postgresql://", 1) if _raw and _raw.startswith("postgres://") else _raw
 
 
+# Connections kept open for reuse by connection()/cursor(); beyond this they are opened per use
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))  # opened when the pool is created (at startup)
+_POOL: Optional[ThreadedConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
 def get_conn():
     """Get a new connection. Raises if DATABASE_URL not set."""
     if not DATABASE_URL:
@@ -25,23 +35,131 @@ def get_conn():
     return psycopg2.connect(DATABASE_URL)
 
 
+def _get_pool() -> ThreadedConnectionPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            if not DATABASE_URL:
+                raise ValueError("DATABASE_URL is not set")
+            _POOL = ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, DATABASE_URL)
+        return _POOL
+
+
+def close_pool() -> None:
+    """Close all pooled connections (app shutdown). The next use opens a new pool."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.closeall()
+            _POOL = None
+
+
 @contextmanager
-def cursor() -> Generator:
-    """Context manager for a connection with dict cursor."""
-    conn = get_conn()
+def _pooled_conn() -> Generator:
+    """Borrow a pooled connection (a fresh one if the pool is exhausted); broken ones are discarded."""
+    pool = _get_pool()
+    try:
+        conn = pool.getconn()
+    except PoolError:
+        conn = get_conn()
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+    try:
+        yield conn
+    finally:
+        if not conn.closed:
+            try:
+                conn.rollback()  # no-op unless a transaction was left open
+            except psycopg2.Error:
+                pass
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def connection() -> Generator:
+    """Context manager for one connection shared by several cursor(conn) transactions."""
+    with _pooled_conn() as conn:
+        yield conn
+
+
+@contextmanager
+def cursor(conn=None) -> Generator:
+    """
+    Context manager for a dict cursor; commits on exit, rolls back on error.
+    Borrows a pooled connection unless ``conn`` is given.
+    """
+    if conn is None:
+        with _pooled_conn() as conn, cursor(conn) as cur:
+            yield cur
+        return
     try:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             yield cur
             conn.commit()
     except Exception:
-        conn.rollback()
+        if not conn.closed:
+            conn.rollback()
         raise
-    finally:
-        conn.close()
+
+
+# Errors meaning the database is unreachable (as opposed to a bad query)
+DB_UNAVAILABLE_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+class CircuitOpenError(Exception):
+    """Raised by CircuitBreaker.call while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Fail fast after fail_max consecutive DB_UNAVAILABLE_ERRORS; after reset_timeout seconds
+    one call is let through (half-open) and a success closes the circuit again.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def call(self, fn, *args, **kwargs):
+        probing = False
+        with self._lock:
+            if self._opened_at is not None:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError()
+                self._opened_at = time.monotonic()  # half-open: this call probes, others keep failing fast
+                probing = True
+        try:
+            out = fn(*args, **kwargs)
+        except DB_UNAVAILABLE_ERRORS:
+            with self._lock:
+                self._failures += 1
+                if self._failures >= self.fail_max:
+                    self._opened_at = time.monotonic()
+            raise
+        except BaseException:
+            # Any other error means the DB answered; a probe must still settle the circuit
+            if probing:
+                with self._lock:
+                    self._failures = 0
+                    self._opened_at = None
+            raise
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+        return out
+
+
+DB_BREAKER = CircuitBreaker()
 
 
 def init_tables() -> None:
-    """Create tables if they don't exist. Idempotent."""
+    """Create tables if they don't exist. Idempotent. Also opens the pool's DB_POOL_MIN connections."""
     if not DATABASE_URL:
         return
 
@@ -134,6 +252,9 @@ def init_tables() -> None:
                 cur.execute("ALTER TABLE wayback_job_snapshots ADD COLUMN IF NOT EXISTS subscribers BIGINT")
             except Exception:
                 pass
+            # Lookups by (platform, canonical_url, timestamp) use the primary key; drop the
+            # redundant covering index earlier builds created (it doubled write cost).
+            cur.execute("DROP INDEX IF EXISTS idx_wayback_snapshot_cache_lookup")
             cur.execute("""
                 CREATE TABLE IF NOT EXISTS public.signal_points (
                     signal_key TEXT NOT NULL,
@@ -270,6 +391,19 @@ def init_tables() -> None:
         pass  # DB may not be available; job endpoints will return 503
 
 
+def vacuum_wayback_snapshot_cache() -> None:
+    """VACUUM (ANALYZE) the snapshot cache so its visibility map stays fresh for index-only scans."""
+    if not DATABASE_URL:
+        return
+    conn = get_conn()
+    try:
+        conn.autocommit = True  # VACUUM cannot run inside a transaction block
+        with conn.cursor() as cur:
+            cur.execute("VACUUM (ANALYZE) wayback_snapshot_cache")
+    finally:
+        conn.close()
+
+
 def upsert_data_update(key: str) -> None:
     """Record current UTC time for a data update key. Idempotent."""
     if not DATABASE_URL:
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Wayback job worker: runs queued Instagram / YouTube / Twitter jobs outside the API process.
+
+Same build as the API; start with:
+  python job_worker.py
+
+Set WAYBACK_JOB_WORKERS=0 on the API so it only records jobs as "queued"; any number of worker
+processes then claim them from wayback_jobs (SELECT ... FOR UPDATE SKIP LOCKED), so crawls scale
+out without touching API latency. Status, progress and results keep coming from Postgres.
+WAYBACK_JOB_WORKER_THREADS (default 4) sets how many jobs one worker runs at once.
+
+Requires DATABASE_URL.
+"""
+
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# Ensure src is on path (when run from /app in container)
+app_dir = Path(__file__).resolve().parent
+src = app_dir / "src"
+if str(src) not in sys.path:
+    sys.path.insert(0, str(src))
+
+try:
+    from dotenv import load_dotenv
+
+    load_dotenv(app_dir / ".env")
+except ImportError:
+    pass
+
+from db import init_tables
+from jobs import work_queued_jobs
+
+
+def main() -> int:
+    init_tables()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    threads = [
+        threading.Thread(target=work_queued_jobs, args=(stop,), name=f"wayback-worker-{i}")
+        for i in range(int(os.getenv("WAYBACK_JOB_WORKER_THREADS", "4")))
+    ]
+    for t in threads:
+        t.start()
+    # Each thread finishes the job it is running before the process exits
+    for t in threads:
+        t.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,23 @@ Uses Postgres cache and job tables. Runs in background.
 Cache-first endpoints return a normalized response (platform, handle, source, snapshots, meta).
 """
 
+import csv
+import io
+import logging
+import multiprocessing
+import os
+import threading
 import time
 import uuid
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import chain
+from typing import Iterator, NamedTuple, Optional
+
+import httpx
+from cachetools import TTLCache
+from psycopg2.extras import RealDictCursor, execute_values
 
 from connectors.wayback_instagram import (
     list_snapshots,
@@ -17,11 +31,42 @@ from connectors.wayback_instagram import (
     _build_archived_url,
     get_instagram_archival_metrics,
 )
-from db import cursor
+from db import connection, cursor
+
+logger = logging.getLogger(__name__)
 
 PLATFORM = "instagram"
 # Internet Archive limit: 15 requests/min (archive.org/details/toomanyrequests_20191110)
 REQUEST_DELAY_S = 4.5  # ~13 req/min; cache hits skip delay
+CACHED_NOTES = "Served from cache. Run a job from Explore for more snapshots."
+WAYBACK_PREFIX = "https://web.archive.org/web/"
+CACHE_ROWS_TTL_S = 30  # in-process reuse of _get_cache_rows results; writes invalidate
+# A running job writes buffered rows, bumps `processed` and re-reads status every
+# JOB_FLUSH_EVERY snapshots or JOB_FLUSH_INTERVAL_S seconds, whichever comes first.
+JOB_FLUSH_EVERY = 5
+JOB_FLUSH_INTERVAL_S = 1.0
+FETCH_CONCURRENCY = 4  # snapshot fetches in flight per job; starts are rate-limited by _WAYBACK_LIMITER
+WAYBACK_BURST = 2  # fetches that may start back to back before REQUEST_DELAY_S pacing applies
+JOB_RESULTS_FETCH = 100  # rows per round trip when streaming job results
+JOB_WORKERS = int(os.getenv("WAYBACK_JOB_WORKERS", "4"))  # jobs running at once; the rest wait as "queued"
+# 0 = the API only records jobs as "queued" and job_worker.py processes pick them up
+
+# HTML parsing is regex-heavy and CPU-bound; run it in worker processes so concurrent
+# jobs (job worker threads) don't serialize on the GIL. Created on first use.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+# Running jobs canceled through this process; runners check it per snapshot without a DB round trip.
+# Entries expire so jobs running elsewhere (job_worker.py, other replicas) never accumulate here;
+# those runners see the cancel on their next flush.
+CANCELED_JOBS_TTL_S = 60
+_CANCELED_JOBS: TTLCache = TTLCache(maxsize=1024, ttl=CANCELED_JOBS_TTL_S)
+_CANCELED_JOBS_LOCK = threading.Lock()
+# Dedicated workers for job runners, so long crawls never hold the request threadpool
+_JOB_POOL = (
+    ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="wayback-job") if JOB_WORKERS > 0 else None
+)
+JOB_POLL_INTERVAL_S = 2.0  # job_worker.py: idle wait between claims of queued jobs
+JOB_WORKER_MAX_BACKOFF_S = 60.0  # job_worker.py: cap on the doubling wait after a failed iteration
 
 
 def _cdx_ts_to_iso(ts: str) -> str:
@@ -33,12 +78,107 @@ def _cdx_ts_to_iso(ts: str) -> str:
     return f"{ts[:4]}-{ts[4:6]}-{ts[6:8]}Z"
 
 
+def _parse_instagram_html(html: str) -> dict:
+    """extract_instagram_metrics in the parse pool; falls back to in-process if the pool breaks."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            # Never fork: this runs in a job thread beside the DB pool and httpx clients, whose
+            # held locks a forked child would inherit. forkserver children start clean.
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=max(2, (os.cpu_count() or 2) // 2),
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        pool = _PARSE_POOL
+    try:
+        return pool.submit(extract_instagram_metrics, html).result()
+    except BrokenProcessPool:
+        with _PARSE_POOL_LOCK:
+            if _PARSE_POOL is pool:
+                _PARSE_POOL = None
+        return extract_instagram_metrics(html)
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket: one token per `interval` seconds, at most `burst` banked.
+    acquire() reserves a token and sleeps until it is due, so waiters are served in order.
+    The interval adapts AIMD-style: slow_down() doubles it (up to max_interval) on a rate-limit
+    response, speed_up() eases it back toward the base interval on success.
+    """
+
+    def __init__(self, interval: float, burst: int, max_interval: Optional[float] = None):
+        self.base_interval = interval
+        self.max_interval = max_interval if max_interval is not None else interval * 8
+        self.interval = interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens * self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def slow_down(self) -> None:
+        with self._lock:
+            self.interval = min(self.max_interval, max(self.interval, self.base_interval) * 2)
+
+    def speed_up(self) -> None:
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval * 0.9)
+
+
+# Shared by every job in the process so concurrent jobs stay within one Wayback request budget
+_WAYBACK_LIMITER = _TokenBucket(REQUEST_DELAY_S, WAYBACK_BURST)
+
+
+def _track_wayback_rate(response: httpx.Response) -> None:
+    """httpx response hook: feed Wayback 429s and successes back into _WAYBACK_LIMITER."""
+    if response.status_code == 429:
+        _WAYBACK_LIMITER.slow_down()
+    elif response.status_code < 400:
+        _WAYBACK_LIMITER.speed_up()
+
+
+def _start_fetches(fetch, snapshots: list[dict]) -> tuple[ThreadPoolExecutor, dict[str, Future]]:
+    """Submit fetch(timestamp, original) for each snapshot to a small thread pool.
+
+    Request starts go through _WAYBACK_LIMITER, so Wayback sees the same mean rate as a serial
+    loop; only the round trips overlap. Returns (pool, {timestamp: future}); caller shuts the pool down.
+    """
+
+    def run(timestamp: str, original_url: str):
+        _WAYBACK_LIMITER.acquire()
+        return fetch(timestamp, original_url)
+
+    pool = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY)
+    futures = {s["timestamp"]: pool.submit(run, s["timestamp"], s["original"]) for s in snapshots}
+    return pool, futures
+
+
+class CacheSnapshot(NamedTuple):
+    """One normalized cache-first snapshot. Tuple layout; converted to a dict only in the response."""
+    timestamp: str
+    followers: Optional[int]
+    snapshot_url: Optional[str]
+    raw: Optional[dict] = None
+
+
 def _build_cache_first_response(
     platform: str,
     handle: str,
     canonical_url: str,
     source: str,
-    snapshots: list[dict],
+    snapshots: list[CacheSnapshot],
     cache_rows: int,
     wayback_calls: int,
     rate_limited: bool = False,
@@ -51,7 +191,7 @@ def _build_cache_first_response(
         "handle": handle,
         "canonical_url": canonical_url,
         "source": source,
-        "snapshots": snapshots,
+        "snapshots": [s._asdict() for s in snapshots],
         "meta": {
             "cache_hit": source == "cache",
             "cache_rows": cache_rows,
@@ -63,213 +203,245 @@ def _build_cache_first_response(
     }
 
 
-def _run_instagram_job(job_id: str) -> None:
-    """Execute job: fetch snapshots, check cache, extract metrics, persist."""
-    try:
-        with cursor() as cur:
-            cur.execute(
-                "SELECT username, canonical_url, from_year, to_year, from_date, to_date, sample FROM wayback_jobs WHERE job_id = %s",
-                (job_id,),
-            )
-            row = cur.fetchone()
-            if not row:
-                return
-            username = row["username"]
-            canonical_url = row["canonical_url"]
-            from_year = row["from_year"]
-            to_year = row["to_year"]
-            from_date = row.get("from_date")
-            to_date = row.get("to_date")
-            sample = row["sample"]
+def _complete_job(job_id: str, platform: str, conn=None) -> None:
+    """
+    Mark job completed. Cached/fetched/with-metrics counts and the summary are derived in one
+    statement from wayback_job_snapshots and the job's own found/sampled columns.
+    """
+    has_metrics = " OR ".join(f"{k} IS NOT NULL" for k in _PLATFORMS[platform]["metric_keys"])
+    with cursor(conn) as cur:
+        cur.execute(
+            f"""
+            UPDATE wayback_jobs SET
+                status = 'completed', finished_at = NOW(),
+                snapshots_with_metrics = sub.wm, snapshots_cached = sub.c, snapshots_fetched = sub.f,
+                summary = CASE
+                    WHEN COALESCE(snapshots_sampled, 0) = 0 AND COALESCE(snapshots_found, 0) = 0
+                        THEN 'No Wayback snapshots found for selected date range.'
+                    WHEN COALESCE(snapshots_sampled, 0) = 0 THEN 'No snapshots sampled (unexpected).'
+                    WHEN sub.wm = 0 THEN 'Snapshots found but no extractable metrics.'
+                    WHEN sub.c = snapshots_sampled THEN 'All snapshots served from cache.'
+                END
+            FROM (
+                SELECT
+                    COUNT(*) FILTER (WHERE {has_metrics}) AS wm,
+                    COUNT(*) FILTER (WHERE source = 'cache') AS c,
+                    COUNT(*) FILTER (WHERE source = 'wayback') AS f
+                FROM wayback_job_snapshots
+                WHERE job_id = %(job_id)s
+            ) sub
+            WHERE wayback_jobs.job_id = %(job_id)s
+            """,
+            {"job_id": job_id},
+        )
+
+
+class _JobWriter:
+    """
+    Buffers a job's processed snapshots and writes them on the JOB_FLUSH_EVERY / JOB_FLUSH_INTERVAL_S
+    boundary: one statement upserts the fetched rows into wayback_snapshot_cache and every row into
+    wayback_job_snapshots, then progress is bumped and cancellation read in the same transaction.
+    """
 
+    def __init__(self, job_id: str, platform: str, username: str, canonical_url: str, conn=None):
+        self.job_id = job_id
+        self._conn = conn
+        self._job = (job_id, platform, username, canonical_url)
+        metrics = _PLATFORMS[platform]["metric_keys"]
+        cols = ", ".join(metrics)
+        sets = "".join(f"{c} = EXCLUDED.{c}, " for c in metrics)
+        # Casts type the VALUES list even when the first row is all NULLs
+        self._template = (
+            "(%s::uuid, %s, %s, %s, %s, %s, %s, " + "%s::bigint, " * len(metrics) + "%s::double precision, %s, %s, %s)"
+        )
+        self._sql = f"""
+            WITH v (job_id, platform, username, canonical_url, timestamp, original_url, archived_url,
+                    {cols}, confidence, evidence, source, to_cache) AS (VALUES %s),
+            c AS (
+                INSERT INTO wayback_snapshot_cache
+                (platform, username, canonical_url, timestamp, original_url, archived_url, {cols}, confidence, evidence)
+                SELECT platform, username, canonical_url, timestamp, original_url, archived_url, {cols}, confidence, evidence
+                FROM v WHERE to_cache
+                ON CONFLICT (platform, canonical_url, timestamp)
+                DO UPDATE SET {sets}confidence = EXCLUDED.confidence, evidence = EXCLUDED.evidence, fetched_at = NOW()
+            )
+            INSERT INTO wayback_job_snapshots
+            (job_id, timestamp, archived_url, {cols}, confidence, evidence, source)
+            SELECT job_id, timestamp, archived_url, {cols}, confidence, evidence, source FROM v
+            ON CONFLICT (job_id, timestamp) DO UPDATE SET
+                archived_url = EXCLUDED.archived_url, {sets}confidence = EXCLUDED.confidence,
+                evidence = EXCLUDED.evidence, source = EXCLUDED.source
+        """
+        # Keyed by timestamp: one statement cannot upsert the same key twice
+        self._rows: dict[str, tuple] = {}
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+
+    def add(self, row: tuple, to_cache: bool = False) -> bool:
+        """
+        Buffer one processed snapshot: (timestamp, original_url, archived_url, *metrics, confidence,
+        evidence, source). to_cache also upserts it into the snapshot cache. Returns True if the job was canceled.
+        """
+        self._rows[row[0]] = (*self._job, *row, to_cache)
+        self._pending += 1
+        with _CANCELED_JOBS_LOCK:
+            canceled = self.job_id in _CANCELED_JOBS
+        if canceled:
+            self.flush()
+            return True
+        # Flushing also re-reads status, which catches cancels made from other workers
+        if (
+            self._pending >= JOB_FLUSH_EVERY
+            or time.monotonic() - self._flushed_at > JOB_FLUSH_INTERVAL_S
+        ):
+            return self.flush()
+        return False
+
+    def flush(self) -> bool:
+        """Write buffered rows. Returns True if the job was canceled."""
+        if not self._pending:
+            return False
+        cached_any = any(r[-1] for r in self._rows.values())
+        with cursor(self._conn) as cur:
+            execute_values(cur, self._sql, list(self._rows.values()), template=self._template)
             cur.execute(
-                "UPDATE wayback_jobs SET status = %s, started_at = NOW() WHERE job_id = %s",
-                ("running", job_id),
+                "UPDATE wayback_jobs SET processed = processed + %s WHERE job_id = %s RETURNING status",
+                (self._pending, self.job_id),
             )
+            r = cur.fetchone()
+        if cached_any:
+            _invalidate_cache_rows(self._job[1], self._job[3])
+        self._rows.clear()
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+        if r and r["status"] == "canceled":
+            with _CANCELED_JOBS_LOCK:
+                _CANCELED_JOBS.pop(self.job_id, None)
+            return True
+        return False
+
+
+def submit_job(runner, job_id: str) -> Optional[Future]:
+    """Queue runner(job_id) on the job worker pool. Returns immediately; None when jobs run out of process."""
+    if _JOB_POOL is None:
+        return None
+    return _JOB_POOL.submit(_run_if_claimed, runner, job_id)
 
-        raw_snapshots = list_snapshots(
-            canonical_url,
-            from_year=from_year,
-            to_year=to_year,
-            from_date=from_date,
-            to_date=to_date,
-            limit=500,
+
+def _run_if_claimed(runner, job_id: str) -> None:
+    """Run a pooled job unless it was canceled or a job_worker.py process took it while it waited."""
+    with cursor() as cur:
+        cur.execute(
+            "UPDATE wayback_jobs SET status = 'running', started_at = NOW() WHERE job_id = %s AND status = 'queued'",
+            (job_id,),
         )
-        deduped = deduplicate_snapshots(raw_snapshots)
-        sampled = evenly_sample_snapshots(deduped, sample)
-        total = len(sampled)
-        snapshots_found = len(deduped)
-        snapshots_sampled = len(sampled)
+        claimed = cur.rowcount > 0
+    if claimed:
+        runner(job_id)
 
-        with cursor() as cur:
-            cur.execute(
-                "UPDATE wayback_jobs SET total = %s, snapshots_found = %s, snapshots_sampled = %s WHERE job_id = %s",
-                (total, snapshots_found, snapshots_sampled, job_id),
-            )
 
-        processed = 0
-        snapshots_cached = 0
-        snapshots_fetched = 0
-        snapshots_with_metrics = 0
-        for s in sampled:
-            with cursor() as cur:
+def _run_instagram_job(job_id: str) -> None:
+    """Execute job: fetch snapshots, check cache, extract metrics, persist."""
+    try:
+        with connection() as conn:
+            with cursor(conn) as cur:
                 cur.execute(
-                    "SELECT status FROM wayback_jobs WHERE job_id = %s",
+                    "SELECT username, canonical_url, from_year, to_year, from_date, to_date, sample FROM wayback_jobs WHERE job_id = %s",
                     (job_id,),
                 )
-                r = cur.fetchone()
-                if r and r["status"] == "canceled":
+                row = cur.fetchone()
+                if not row:
                     return
+                username = row["username"]
+                canonical_url = row["canonical_url"]
+                from_year = row["from_year"]
+                to_year = row["to_year"]
+                from_date = row.get("from_date")
+                to_date = row.get("to_date")
+                sample = row["sample"]
 
-            timestamp = s["timestamp"]
-            original_url = s["original"]
-            archived_url = _build_archived_url(timestamp, original_url)
-            platform = PLATFORM
-
-            # Check cache
-            with cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT followers, following, posts, confidence, evidence
-                    FROM wayback_snapshot_cache
-                    WHERE platform = %s AND canonical_url = %s AND timestamp = %s
-                    """,
-                    (platform, canonical_url, timestamp),
+                    "UPDATE wayback_jobs SET status = %s, started_at = NOW() WHERE job_id = %s",
+                    ("running", job_id),
                 )
-                cached = cur.fetchone()
 
-            # Use cache only if we have at least one metric (null cache = re-fetch for improved extraction)
-            has_metrics = cached and (
-                cached.get("followers") is not None
-                or cached.get("following") is not None
-                or cached.get("posts") is not None
+            raw_snapshots = list_snapshots(
+                canonical_url,
+                from_year=from_year,
+                to_year=to_year,
+                from_date=from_date,
+                to_date=to_date,
+                limit=500,
             )
-            if has_metrics:
-                source = "cache"
-                snapshots_cached += 1
-                followers = cached["followers"]
-                following = cached["following"]
-                posts = cached["posts"]
-                confidence = float(cached["confidence"] or 0.2)
-                evidence = cached["evidence"]
-            else:
-                source = "wayback"
-                snapshots_fetched += 1
-                time.sleep(REQUEST_DELAY_S)
-                html, _ = fetch_snapshot_html(timestamp, original_url)
-                if html:
-                    metrics = extract_instagram_metrics(html)
-                    followers = metrics["followers"]["value"]
-                    following = metrics["following"]["value"]
-                    posts = metrics["posts"]["value"]
-                    confs = [m["confidence"] for m in metrics.values() if m["value"] is not None]
-                    confidence = round(max(confs, default=0.2), 2) if confs else 0.2
-                    evidence = next((m["evidence"] for m in metrics.values() if m["evidence"]), None)
-                else:
-                    followers = following = posts = None
-                    confidence = 0.0
-                    evidence = None
-
-                # Upsert cache
-                with cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO wayback_snapshot_cache
-                        (platform, username, canonical_url, timestamp, original_url, archived_url,
-                         followers, following, posts, confidence, evidence)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (platform, canonical_url, timestamp)
-                        DO UPDATE SET
-                            followers = EXCLUDED.followers,
-                            following = EXCLUDED.following,
-                            posts = EXCLUDED.posts,
-                            confidence = EXCLUDED.confidence,
-                            evidence = EXCLUDED.evidence,
-                            fetched_at = NOW()
-                        """,
-                        (
-                            platform,
-                            username,
-                            canonical_url,
-                            timestamp,
-                            original_url,
-                            archived_url,
-                            followers,
-                            following,
-                            posts,
-                            confidence,
-                            evidence,
-                        ),
-                    )
+            deduped = deduplicate_snapshots(raw_snapshots)
+            sampled = evenly_sample_snapshots(deduped, sample)
+            total = len(sampled)
+            snapshots_found = len(deduped)
+            snapshots_sampled = len(sampled)
 
-            # Insert job snapshot
-            with cursor() as cur:
+            with cursor(conn) as cur:
                 cur.execute(
-                    """
-                    INSERT INTO wayback_job_snapshots
-                    (job_id, timestamp, archived_url, followers, following, posts, confidence, evidence, source)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (job_id, timestamp) DO UPDATE SET
-                        archived_url = EXCLUDED.archived_url,
-                        followers = EXCLUDED.followers,
-                        following = EXCLUDED.following,
-                        posts = EXCLUDED.posts,
-                        confidence = EXCLUDED.confidence,
-                        evidence = EXCLUDED.evidence,
-                        source = EXCLUDED.source
-                    """,
-                    (
-                        job_id,
-                        timestamp,
-                        archived_url,
-                        followers,
-                        following,
-                        posts,
-                        confidence,
-                        evidence,
-                        source,
-                    ),
+                    "UPDATE wayback_jobs SET total = %s, snapshots_found = %s, snapshots_sampled = %s WHERE job_id = %s",
+                    (total, snapshots_found, snapshots_sampled, job_id),
                 )
-                processed += 1
-                if followers is not None or following is not None or posts is not None:
-                    snapshots_with_metrics += 1
-                cur.execute(
-                    "UPDATE wayback_jobs SET processed = %s WHERE job_id = %s",
-                    (processed, job_id),
-                )
-
-        # Build summary for transparency
-        if snapshots_sampled == 0:
-            if snapshots_found == 0:
-                summary = "No Wayback snapshots found for selected date range."
-            else:
-                summary = "No snapshots sampled (unexpected)."
-        elif snapshots_with_metrics == 0:
-            summary = "Snapshots found but no extractable metrics."
-        elif snapshots_cached == snapshots_sampled:
-            summary = "All snapshots served from cache."
-        else:
-            summary = None
 
-        with cursor() as cur:
-            cur.execute(
-                """
-                UPDATE wayback_jobs SET
-                    status = %s, finished_at = NOW(),
-                    snapshots_with_metrics = %s, snapshots_cached = %s, snapshots_fetched = %s,
-                    summary = %s
-                WHERE job_id = %s
-                """,
-                (
-                    "completed",
-                    snapshots_with_metrics,
-                    snapshots_cached,
-                    snapshots_fetched,
-                    summary,
-                    job_id,
-                ),
+            cache_map = _get_cached_by_timestamp(
+                PLATFORM,
+                canonical_url,
+                [s["timestamp"] for s in sampled],
+                ("followers", "following", "posts", "confidence", "evidence"),
+                conn,
             )
 
+            writer = _JobWriter(job_id, PLATFORM, username, canonical_url, conn)
+            for s in sampled:
+                timestamp = s["timestamp"]
+                original_url = s["original"]
+                archived_url = _build_archived_url(timestamp, original_url)
+                cached = cache_map.get(timestamp)
+
+                # Use cache only if we have at least one metric (null cache = re-fetch for improved extraction)
+                has_metrics = cached and (
+                    cached.get("followers") is not None
+                    or cached.get("following") is not None
+                    or cached.get("posts") is not None
+                )
+                if has_metrics:
+                    source = "cache"
+                    to_cache = False
+                    followers = cached["followers"]
+                    following = cached["following"]
+                    posts = cached["posts"]
+                    confidence = float(cached["confidence"] or 0.2)
+                    evidence = cached["evidence"]
+                else:
+                    source = "wayback"
+                    _WAYBACK_LIMITER.acquire()
+                    html, _ = fetch_snapshot_html(timestamp, original_url, delay=0)
+                    if html:
+                        metrics = _parse_instagram_html(html)
+                        followers = metrics["followers"]["value"]
+                        following = metrics["following"]["value"]
+                        posts = metrics["posts"]["value"]
+                        confs = [m["confidence"] for m in metrics.values() if m["value"] is not None]
+                        confidence = round(max(confs, default=0.2), 2) if confs else 0.2
+                        evidence = next((m["evidence"] for m in metrics.values() if m["evidence"]), None)
+                        to_cache = True
+                    else:
+                        # Failed fetch: leave the cache alone rather than storing an all-null row
+                        to_cache = False
+                        followers = following = posts = None
+                        confidence = 0.0
+                        evidence = None
+
+                snapshot_row = (timestamp, original_url, archived_url, followers, following, posts, confidence, evidence, source)
+                if writer.add(snapshot_row, to_cache):
+                    return
+            if writer.flush():
+                return
+
+            _complete_job(job_id, PLATFORM, conn)
+
     except Exception as e:
         with cursor() as cur:
             cur.execute(
@@ -283,6 +455,18 @@ def _normalize_instagram_username(username: str) -> str:
     return (username or "").strip().replace("@", "").lower()
 
 
+def _project_cached_result(r: dict, metric_keys: tuple[str, ...]) -> dict:
+    """Project a cache row to result format; metric_keys differ per platform (e.g. followers vs subscribers)."""
+    out = {"timestamp": r["timestamp"], "archived_url": r.get("archived_url")}
+    for key in metric_keys:
+        out[key] = r.get(key)
+    confidence = r.get("confidence")
+    out["confidence"] = float(confidence) if confidence is not None else 0.2
+    out["evidence"] = r.get("evidence")
+    out["source"] = "cache"
+    return out
+
+
 def get_cached_instagram_snapshots(username: str) -> Optional[dict]:
     """Return cached Instagram snapshots for a username, or None if no cache or DB unavailable."""
     username = _normalize_instagram_username(username)
@@ -293,40 +477,28 @@ def get_cached_instagram_snapshots(username: str) -> Optional[dict]:
         with cursor() as cur:
             cur.execute(
                 """
-                SELECT DISTINCT ON (timestamp) timestamp, archived_url, followers, following, posts, confidence, evidence, fetched_at
+                SELECT DISTINCT ON (timestamp) timestamp, archived_url, followers, following, posts, confidence, evidence,
+                       MAX(fetched_at) OVER () AS last_cached_at
                 FROM wayback_snapshot_cache
                 WHERE platform = %s AND LOWER(canonical_url) = LOWER(%s)
                 ORDER BY timestamp ASC, fetched_at DESC NULLS LAST
                 """,
                 (PLATFORM, canonical_url),
             )
-            rows = [dict(r) for r in cur.fetchall()]
+            rows = cur.fetchall()
     except Exception:
         return None
     if not rows:
         return None
-    fa_values = [r.get("fetched_at") for r in rows if r.get("fetched_at")]
-    last_cached_at = max(fa_values).isoformat() if fa_values else None
-    results = [
-        {
-            "timestamp": r["timestamp"],
-            "archived_url": r.get("archived_url"),
-            "followers": r.get("followers"),
-            "following": r.get("following"),
-            "posts": r.get("posts"),
-            "confidence": float(r["confidence"]) if r.get("confidence") is not None else 0.2,
-            "evidence": r.get("evidence"),
-            "source": "cache",
-        }
-        for r in rows
-    ]
+    last_cached_at = rows[0]["last_cached_at"].isoformat() if rows[0]["last_cached_at"] else None
+    results = [_project_cached_result(r, ("followers", "following", "posts")) for r in rows]
     return {
         "platform": "instagram",
         "username": username,
         "results": results,
         "snapshots_total": len(results),
         "snapshots_sampled": len(results),
-        "notes": "Served from cache. Run a job from Explore for more snapshots.",
+        "notes": CACHED_NOTES,
         "metadata": {
             "source": "cache",
             "count": len(results),
@@ -335,49 +507,117 @@ def get_cached_instagram_snapshots(username: str) -> Optional[dict]:
     }
 
 
+def get_cached_instagram_snapshots_json(username: str) -> Optional[str]:
+    """
+    Same payload as get_cached_instagram_snapshots, serialized by Postgres as one JSON document.
+    Skips building a Python dict per row; the endpoint returns the text as-is. None if no cache.
+    """
+    username = _normalize_instagram_username(username)
+    if not username:
+        return None
+    canonical_url = f"https://www.instagram.com/{username}/"
+    try:
+        with cursor() as cur:
+            cur.execute(
+                """
+                SELECT COUNT(*) AS n, json_build_object(
+                    'platform', 'instagram',
+                    'username', %s::text,
+                    'results', json_agg(json_build_object(
+                        'timestamp', t.timestamp,
+                        'archived_url', t.archived_url,
+                        'followers', t.followers,
+                        'following', t.following,
+                        'posts', t.posts,
+                        'confidence', COALESCE(t.confidence, 0.2),
+                        'evidence', t.evidence,
+                        'source', 'cache'
+                    ) ORDER BY t.timestamp),
+                    'snapshots_total', COUNT(*),
+                    'snapshots_sampled', COUNT(*),
+                    'notes', %s::text,
+                    'metadata', json_build_object(
+                        'source', 'cache',
+                        'count', COUNT(*),
+                        'last_cached_at', MAX(t.fetched_at)
+                    )
+                )::text AS body
+                FROM (
+                    SELECT DISTINCT ON (timestamp) timestamp, archived_url, followers, following, posts,
+                           confidence, evidence, fetched_at
+                    FROM wayback_snapshot_cache
+                    WHERE platform = %s AND LOWER(canonical_url) = LOWER(%s)
+                    ORDER BY timestamp ASC, fetched_at DESC NULLS LAST
+                ) t
+                """,
+                (username, CACHED_NOTES, PLATFORM, canonical_url),
+            )
+            row = cur.fetchone()
+    except Exception:
+        return None
+    if not row or not row["n"]:
+        return None
+    return row["body"]
+
+
+def _copy_upsert_cache(platform: str, rows: list[tuple]) -> None:
+    """
+    Bulk-upsert rows of (platform, username, canonical_url, timestamp, original_url, archived_url,
+    *metric_keys, confidence, evidence) into wayback_snapshot_cache: COPY into a temp table, then one
+    INSERT ... SELECT ... ON CONFLICT. Timestamps must be unique within ``rows``.
+    """
+    if not rows:
+        return
+    metrics = _PLATFORMS[platform]["metric_keys"]
+    cols = ", ".join(
+        ("platform", "username", "canonical_url", "timestamp", "original_url", "archived_url", *metrics, "confidence", "evidence")
+    )
+    sets = "".join(f"{c} = EXCLUDED.{c}, " for c in metrics)
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)  # None -> unquoted empty field -> NULL
+    buf.seek(0)
+    with cursor() as cur:
+        cur.execute("CREATE TEMP TABLE cache_seed (LIKE wayback_snapshot_cache INCLUDING DEFAULTS) ON COMMIT DROP")
+        cur.copy_expert(f"COPY cache_seed ({cols}) FROM STDIN WITH (FORMAT csv)", buf)
+        cur.execute(
+            f"""
+            INSERT INTO wayback_snapshot_cache ({cols})
+            SELECT {cols} FROM cache_seed
+            ON CONFLICT (platform, canonical_url, timestamp)
+            DO UPDATE SET {sets}confidence = EXCLUDED.confidence, evidence = EXCLUDED.evidence, fetched_at = NOW()
+            """
+        )
+    _invalidate_cache_rows(platform, rows[0][2])
+
+
 def _upsert_instagram_cache(username: str, results: list[dict]) -> None:
     """Upsert live fetch results into wayback_snapshot_cache. Seeds future cache reads."""
     username = _normalize_instagram_username(username)
     if not username:
         return
     canonical_url = f"https://www.instagram.com/{username}/"
+    # Keyed by timestamp: one VALUES list cannot touch the same conflict row twice.
+    rows = {
+        r["timestamp"]: (
+            PLATFORM,
+            username,
+            canonical_url,
+            r["timestamp"],
+            r.get("original_url", ""),
+            r.get("archived_url"),
+            r.get("followers"),
+            r.get("following"),
+            r.get("posts"),
+            r.get("confidence") or 0.2,
+            r.get("evidence"),
+        )
+        for r in results
+        if r.get("timestamp")
+    }
+    if not rows:
+        return
     try:
-        with cursor() as cur:
-            for r in results:
-                ts = r.get("timestamp")
-                if not ts:
-                    continue
-                archived_url = r.get("archived_url")
-                original_url = r.get("original_url", "")
-                cur.execute(
-                    """
-                    INSERT INTO wayback_snapshot_cache
-                    (platform, username, canonical_url, timestamp, original_url, archived_url,
-                     followers, following, posts, confidence, evidence)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (platform, canonical_url, timestamp)
-                    DO UPDATE SET
-                        followers = EXCLUDED.followers,
-                        following = EXCLUDED.following,
-                        posts = EXCLUDED.posts,
-                        confidence = EXCLUDED.confidence,
-                        evidence = EXCLUDED.evidence,
-                        fetched_at = NOW()
-                    """,
-                    (
-                        PLATFORM,
-                        username,
-                        canonical_url,
-                        ts,
-                        original_url,
-                        archived_url,
-                        r.get("followers"),
-                        r.get("following"),
-                        r.get("posts"),
-                        r.get("confidence") or 0.2,
-                        r.get("evidence"),
-                    ),
-                )
+        _copy_upsert_cache(PLATFORM, list(rows.values()))
     except Exception:
         pass  # Non-fatal; cache seeding is best-effort
 
@@ -410,89 +650,107 @@ def get_instagram_cache_first(username: str, sample: int = 40) -> dict:
     return live
 
 
-def _get_cache_rows(platform: str, canonical_url: str) -> tuple[list[dict], Optional[str]]:
-    """Return (rows, last_cached_at) from wayback_snapshot_cache for platform + canonical_url."""
+# Columns callers may request from _get_cache_rows (whitelist; names are interpolated into SQL).
+_CACHE_ROW_FIELDS = frozenset({
+    "timestamp", "archived_url", "followers", "following", "posts", "subscribers",
+    "confidence", "evidence", "fetched_at",
+})
+
+
+# Memoized _get_cache_rows results: (platform, canonical_url) -> {(fields, limit): (rows, last_cached_at)}.
+# Bounded, so arbitrary handles can't grow it; grouping per profile lets one pop invalidate every variant.
+_CACHE_ROWS: TTLCache = TTLCache(maxsize=512, ttl=CACHE_ROWS_TTL_S)
+_CACHE_ROWS_LOCK = threading.Lock()
+
+
+def _invalidate_cache_rows(platform: str, canonical_url: str) -> None:
+    """Drop memoized _get_cache_rows results after the cache for this profile changes."""
+    with _CACHE_ROWS_LOCK:
+        _CACHE_ROWS.pop((platform, canonical_url.lower()), None)
+
+
+def _get_cache_rows(
+    platform: str,
+    canonical_url: str,
+    fields: tuple[str, ...] = ("timestamp", "archived_url", "followers"),
+    limit: Optional[int] = None,
+) -> tuple[list[dict], Optional[str]]:
+    """
+    Return (rows, last_cached_at) from wayback_snapshot_cache for platform + canonical_url.
+    Selects only ``fields``; ``limit`` caps rows. last_cached_at is MAX(fetched_at) over all matching rows.
+    """
+    unknown = set(fields) - _CACHE_ROW_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown cache fields: {sorted(unknown)}")
+    profile = (platform, canonical_url.lower())
+    variant = (tuple(fields), limit)
+    with _CACHE_ROWS_LOCK:
+        hit = _CACHE_ROWS.get(profile, {}).get(variant)
+    if hit is not None:
+        return hit
+    sql = f"""
+        SELECT {", ".join(fields)}, MAX(fetched_at) OVER () AS last_cached_at
+        FROM wayback_snapshot_cache
+        WHERE platform = %s AND LOWER(canonical_url) = LOWER(%s)
+        ORDER BY timestamp ASC
+    """
+    params: tuple = (platform, canonical_url)
+    if limit is not None:
+        sql += " LIMIT %s"
+        params += (limit,)
     try:
         with cursor() as cur:
-            cur.execute(
-                """
-                SELECT timestamp, archived_url, followers, following, posts, subscribers, confidence, evidence, fetched_at
-                FROM wayback_snapshot_cache
-                WHERE platform = %s AND LOWER(canonical_url) = LOWER(%s)
-                ORDER BY timestamp ASC
-                """,
-                (platform, canonical_url),
-            )
+            cur.execute(sql, params)
             rows = [dict(r) for r in cur.fetchall()]
     except Exception:
         return [], None
-    fa_values = [r.get("fetched_at") for r in rows if r.get("fetched_at")]
-    last_cached_at = max(fa_values).isoformat() if fa_values else None
+    if not rows:
+        return [], None
+    last_cached_at = rows[0]["last_cached_at"].isoformat() if rows[0]["last_cached_at"] else None
+    with _CACHE_ROWS_LOCK:
+        variants = _CACHE_ROWS.get(profile)
+        if variants is None:
+            variants = _CACHE_ROWS[profile] = {}
+        variants[variant] = (rows, last_cached_at)
     return rows, last_cached_at
 
 
-def _rows_to_snapshots_instagram(rows: list[dict]) -> list[dict]:
-    """Build normalized snapshot list from cache rows (Instagram)."""
-    out = []
-    for r in rows:
-        ts = r.get("timestamp")
-        out.append({
-            "timestamp": _cdx_ts_to_iso(ts) if ts else "",
-            "followers": r.get("followers"),
-            "snapshot_url": r.get("archived_url"),
-            "raw": None,
-        })
-    return out
-
-
-def cache_first_instagram(
-    handle: str,
-    force_live: bool = False,
-    limit: Optional[int] = None,
-) -> dict:
-    """
-    Normalized cache-first: return cache only if present and not force_live;
-    else one live fetch, upsert, return. source in {cache, live, mixed}.
-    """
-    handle_norm = _normalize_instagram_username(handle)
-    if not handle_norm:
-        return _build_cache_first_response(
-            "instagram", handle, "", "live", [], 0, 0, notes=["Invalid handle."]
+def _get_cached_by_timestamp(
+    platform: str,
+    canonical_url: str,
+    timestamps: list[str],
+    fields: tuple[str, ...],
+    conn=None,
+) -> dict[str, dict]:
+    """Cache rows for the given snapshot timestamps in one query, keyed by timestamp."""
+    unknown = set(fields) - _CACHE_ROW_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown cache fields: {sorted(unknown)}")
+    if not timestamps:
+        return {}
+    with cursor(conn) as cur:
+        cur.execute(
+            f"""
+            SELECT timestamp, {", ".join(fields)}
+            FROM wayback_snapshot_cache
+            WHERE platform = %s AND canonical_url = %s AND timestamp = ANY(%s)
+            """,
+            (platform, canonical_url, list(timestamps)),
         )
-    canonical_url = f"https://www.instagram.com/{handle_norm}/"
-    sample = min(max(limit or 40, 1), 100)
+        return {r["timestamp"]: r for r in cur.fetchall()}
 
-    cache_rows, last_cached_at = _get_cache_rows(PLATFORM, canonical_url)
-    if cache_rows and not force_live:
-        snapshots = _rows_to_snapshots_instagram(cache_rows)
-        return _build_cache_first_response(
-            "instagram", handle_norm, canonical_url, "cache",
-            snapshots, len(cache_rows), 0,
-            last_cached_at=last_cached_at,
-        )
 
-    # One live batch (no retries)
-    live = get_instagram_archival_metrics(
-        username=handle_norm, sample=sample, include_evidence=True, progress=False,
-    )
-    results = live.get("results", [])
-    if results:
-        _upsert_instagram_cache(handle_norm, results)
-    snapshots = []
-    for r in results:
-        ts = r.get("timestamp")
-        snapshots.append({
-            "timestamp": _cdx_ts_to_iso(ts) if ts else "",
-            "followers": r.get("followers"),
-            "snapshot_url": r.get("archived_url"),
-            "raw": None,
-        })
-    source = "mixed" if cache_rows else "live"
-    return _build_cache_first_response(
-        "instagram", handle_norm, canonical_url, source,
-        snapshots, len(cache_rows), len(results),
-        last_cached_at=last_cached_at if cache_rows else None,
-    )
+def _rows_to_snapshots(rows: list[dict], follower_key: str = "followers") -> list[CacheSnapshot]:
+    """Build normalized snapshot list from cache rows or live results.
+
+    follower_key names the count column to expose as ``followers`` (YouTube: ``subscribers``).
+    """
+    cdx = _cdx_ts_to_iso
+    return [
+        CacheSnapshot(cdx(ts) if ts else "", r.get(follower_key), r.get("archived_url"))
+        for r in rows
+        for ts in (r.get("timestamp"),)
+    ]
 
 
 def create_instagram_job(
@@ -590,30 +848,18 @@ def get_job(job_id: str) -> Optional[dict]:
 
         # Merge: job results + cache, dedupe by timestamp.
         # Prefer non-null over null (job may have stale nulls from before extraction fixes).
-        def _has_metrics(x: dict) -> bool:
-            if platform == PLATFORM_YOUTUBE:
-                return x.get("subscribers") is not None
-            if platform == PLATFORM_TWITTER:
-                return x.get("followers") is not None
-            return (
-                x.get("followers") is not None
-                or x.get("following") is not None
-                or x.get("posts") is not None
-            )
+        metric_keys = _PLATFORMS.get(platform, _PLATFORMS[PLATFORM])["metric_keys"]
 
-        def _row_to_result_platform(r: dict) -> dict:
-            out = _row_to_result(r)
-            if platform == PLATFORM_YOUTUBE:
-                out["subscribers"] = r.get("subscribers")
-            return out
+        def _has_metrics(x: dict) -> bool:
+            return any(x.get(k) is not None for k in metric_keys)
 
         seen: dict[str, dict] = {}
         for r in job["results"]:
-            row = _row_to_result_platform(r)
+            row = _row_to_result(r)
             seen[row["timestamp"]] = row
         for r in cache_rows:
             ts = r["timestamp"]
-            cache_row = _row_to_result_platform(r)
+            cache_row = _row_to_result(r)
             cache_row["source"] = "cache"
             if ts not in seen or (
                 _has_metrics(cache_row) and not _has_metrics(seen[ts])
@@ -624,19 +870,57 @@ def get_job(job_id: str) -> Optional[dict]:
         return job
 
 
-def get_job_results(job_id: str) -> list[dict]:
-    """Get results rows for a job."""
+def get_job_results(job_id: str) -> Optional[list[dict]]:
+    """Get results rows for a job, or None if the job does not exist (one round trip)."""
     with cursor() as cur:
         cur.execute(
             """
-            SELECT timestamp, archived_url, followers, following, posts, confidence, evidence, source
-            FROM wayback_job_snapshots
-            WHERE job_id = %s
-            ORDER BY timestamp DESC
+            SELECT s.timestamp, s.archived_url, s.followers, s.following, s.posts,
+                   s.confidence, s.evidence, s.source
+            FROM wayback_jobs j
+            LEFT JOIN wayback_job_snapshots s ON s.job_id = j.job_id
+            WHERE j.job_id = %s
+            ORDER BY s.timestamp DESC
             """,
             (job_id,),
         )
-        return [dict(r) for r in cur.fetchall()]
+        rows = cur.fetchall()
+    if not rows:
+        return None
+    # A job without snapshots yields one all-NULL row from the LEFT JOIN
+    return [dict(r) for r in rows if r["timestamp"] is not None]
+
+
+def iter_job_results(job_id: str) -> Optional[Iterator[dict]]:
+    """
+    Like get_job_results, but rows stream from a server-side cursor (JOB_RESULTS_FETCH per round
+    trip) so a large job is never held in memory. None if the job does not exist.
+    """
+    rows = _job_result_rows(job_id)
+    first = next(rows, None)  # existence is known before the caller starts a response
+    if first is None or first["timestamp"] is None:
+        # Missing job, or a job without snapshots (one all-NULL row from the LEFT JOIN)
+        rows.close()
+        return None if first is None else iter(())
+    return chain((first,), rows)
+
+
+def _job_result_rows(job_id: str) -> Iterator[dict]:
+    with connection() as conn, conn.cursor(name=f"job_results_{uuid.uuid4().hex}", cursor_factory=RealDictCursor) as cur:
+        cur.itersize = JOB_RESULTS_FETCH
+        cur.execute(
+            """
+            SELECT s.timestamp, s.archived_url, s.followers, s.following, s.posts,
+                   s.confidence, s.evidence, s.source
+            FROM wayback_jobs j
+            LEFT JOIN wayback_job_snapshots s ON s.job_id = j.job_id
+            WHERE j.job_id = %s
+            ORDER BY s.timestamp DESC
+            """,
+            (job_id,),
+        )
+        for r in cur:
+            yield dict(r)
 
 
 def list_jobs(
@@ -683,10 +967,21 @@ def cancel_job(job_id: str) -> bool:
     """Set job status to canceled. Returns True if updated."""
     with cursor() as cur:
         cur.execute(
-            "UPDATE wayback_jobs SET status = 'canceled' WHERE job_id = %s AND status IN ('queued', 'running')",
+            "UPDATE wayback_jobs SET status = 'canceled' WHERE job_id = %s AND status = 'queued'",
             (job_id,),
         )
-        return cur.rowcount > 0
+        if cur.rowcount > 0:
+            # Never started: the claim in _run_if_claimed / claim_queued_job now skips it
+            return True
+        cur.execute(
+            "UPDATE wayback_jobs SET status = 'canceled' WHERE job_id = %s AND status = 'running'",
+            (job_id,),
+        )
+        canceled = cur.rowcount > 0
+    if canceled:
+        with _CANCELED_JOBS_LOCK:
+            _CANCELED_JOBS[job_id] = True
+    return canceled
 
 
 def delete_job(job_id: str) -> bool:
@@ -704,115 +999,27 @@ PLATFORM_TWITTER = "twitter"
 
 def _upsert_twitter_cache(username: str, canonical_url: str, results: list[dict]) -> None:
     """Upsert live fetch results into wayback_snapshot_cache. Seeds cache-first reads."""
+    rows = {
+        r["timestamp"]: (
+            PLATFORM_TWITTER,
+            username,
+            canonical_url,
+            r["timestamp"],
+            r.get("original_url", r.get("original", "")),
+            r.get("archived_url"),
+            r.get("followers"),
+            r.get("confidence") or 0.2,
+            r.get("evidence"),
+        )
+        for r in results
+        if r.get("timestamp")
+    }
     try:
-        with cursor() as cur:
-            for r in results:
-                ts = r.get("timestamp")
-                if not ts:
-                    continue
-                archived_url = r.get("archived_url")
-                original_url = r.get("original_url", r.get("original", ""))
-                cur.execute(
-                    """
-                    INSERT INTO wayback_snapshot_cache
-                    (platform, username, canonical_url, timestamp, original_url, archived_url,
-                     followers, confidence, evidence)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (platform, canonical_url, timestamp)
-                    DO UPDATE SET
-                        followers = EXCLUDED.followers,
-                        confidence = EXCLUDED.confidence,
-                        evidence = EXCLUDED.evidence,
-                        fetched_at = NOW()
-                    """,
-                    (
-                        PLATFORM_TWITTER,
-                        username,
-                        canonical_url,
-                        ts,
-                        original_url,
-                        archived_url,
-                        r.get("followers"),
-                        r.get("confidence") or 0.2,
-                        r.get("evidence"),
-                    ),
-                )
+        _copy_upsert_cache(PLATFORM_TWITTER, list(rows.values()))
     except Exception:
         pass
 
 
-def _rows_to_snapshots_twitter(rows: list[dict]) -> list[dict]:
-    """Build normalized snapshot list from cache rows (Twitter)."""
-    out = []
-    for r in rows:
-        ts = r.get("timestamp")
-        out.append({
-            "timestamp": _cdx_ts_to_iso(ts) if ts else "",
-            "followers": r.get("followers"),
-            "snapshot_url": r.get("archived_url"),
-            "raw": None,
-        })
-    return out
-
-
-def cache_first_twitter(
-    handle: str,
-    force_live: bool = False,
-    limit: Optional[int] = None,
-) -> dict:
-    """
-    Normalized cache-first: return cache only if present and not force_live;
-    else one live fetch, upsert, return. source in {cache, live, mixed}.
-    """
-    from signalmap.connectors.wayback_twitter import (
-        normalize_username,
-        get_twitter_archival_metrics,
-    )
-
-    handle_stripped = (handle or "").strip()
-    if not handle_stripped:
-        return _build_cache_first_response(
-            "twitter", handle, "", "live", [], 0, 0, notes=["Invalid handle."]
-        )
-    norm_username, canonical_url = normalize_username(handle_stripped)
-    if not canonical_url:
-        return _build_cache_first_response(
-            "twitter", handle_stripped, "", "live", [], 0, 0, notes=["Invalid Twitter handle or URL."]
-        )
-    sample = min(max(limit or 40, 1), 100)
-
-    cache_rows, last_cached_at = _get_cache_rows(PLATFORM_TWITTER, canonical_url)
-    if cache_rows and not force_live:
-        snapshots = _rows_to_snapshots_twitter(cache_rows)
-        return _build_cache_first_response(
-            "twitter", norm_username, canonical_url, "cache",
-            snapshots, len(cache_rows), 0,
-            last_cached_at=last_cached_at,
-        )
-
-    live = get_twitter_archival_metrics(
-        username=handle_stripped, from_year=2009, to_year=2026, sample=sample,
-    )
-    results = live.get("results", [])
-    if results:
-        _upsert_twitter_cache(norm_username, canonical_url, results)
-    snapshots = []
-    for r in results:
-        ts = r.get("timestamp")
-        snapshots.append({
-            "timestamp": _cdx_ts_to_iso(ts) if ts else "",
-            "followers": r.get("followers"),
-            "snapshot_url": r.get("archived_url"),
-            "raw": None,
-        })
-    source = "mixed" if cache_rows else "live"
-    return _build_cache_first_response(
-        "twitter", norm_username, canonical_url, source,
-        snapshots, len(cache_rows), len(results),
-        last_cached_at=last_cached_at if cache_rows else None,
-    )
-
-
 def create_twitter_job(
     username: str,
     from_year: Optional[int] = None,
@@ -852,189 +1059,107 @@ def _run_twitter_job(job_id: str) -> None:
         list_snapshots,
         evenly_sample,
         fetch_snapshot_html,
+        new_client,
         extract_followers,
     )
 
     try:
-        with cursor() as cur:
-            cur.execute(
-                "SELECT username, canonical_url, from_year, to_year, from_date, to_date, sample FROM wayback_jobs WHERE job_id = %s",
-                (job_id,),
-            )
-            row = cur.fetchone()
-            if not row:
-                return
-            username = row["username"]
-            canonical_url = row["canonical_url"]
-            from_year = row["from_year"]
-            to_year = row["to_year"]
-            from_date = row.get("from_date")
-            to_date = row.get("to_date")
-            sample = row["sample"]
-
-            cur.execute(
-                "UPDATE wayback_jobs SET status = %s, started_at = NOW() WHERE job_id = %s",
-                ("running", job_id),
-            )
-
-        raw_snapshots = list_snapshots(
-            canonical_url,
-            from_year=from_year,
-            to_year=to_year,
-            from_date=from_date,
-            to_date=to_date,
-            limit=2000,
-        )
-        sampled = evenly_sample(raw_snapshots, sample=sample)
-        total = len(sampled)
-        snapshots_found = len(raw_snapshots)
-        snapshots_sampled = len(sampled)
-
-        with cursor() as cur:
-            cur.execute(
-                "UPDATE wayback_jobs SET total = %s, snapshots_found = %s, snapshots_sampled = %s WHERE job_id = %s",
-                (total, snapshots_found, snapshots_sampled, job_id),
-            )
-
-        processed = 0
-        snapshots_cached = 0
-        snapshots_fetched = 0
-        snapshots_with_metrics = 0
-        for s in sampled:
-            with cursor() as cur:
+        with connection() as conn:
+            with cursor(conn) as cur:
                 cur.execute(
-                    "SELECT status FROM wayback_jobs WHERE job_id = %s",
+                    "SELECT username, canonical_url, from_year, to_year, from_date, to_date, sample FROM wayback_jobs WHERE job_id = %s",
                     (job_id,),
                 )
-                r = cur.fetchone()
-                if r and r["status"] == "canceled":
+                row = cur.fetchone()
+                if not row:
                     return
+                username = row["username"]
+                canonical_url = row["canonical_url"]
+                from_year = row["from_year"]
+                to_year = row["to_year"]
+                from_date = row.get("from_date")
+                to_date = row.get("to_date")
+                sample = row["sample"]
 
-            timestamp = s["timestamp"]
-            original_url = s["original"]
-            archived_url = f"https://web.archive.org/web/{timestamp}/{original_url}"
-
-            with cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT followers, confidence, evidence
-                    FROM wayback_snapshot_cache
-                    WHERE platform = %s AND canonical_url = %s AND timestamp = %s
-                    """,
-                    (PLATFORM_TWITTER, canonical_url, timestamp),
+                    "UPDATE wayback_jobs SET status = %s, started_at = NOW() WHERE job_id = %s",
+                    ("running", job_id),
                 )
-                cached = cur.fetchone()
-
-            if cached and cached.get("followers") is not None:
-                source = "cache"
-                snapshots_cached += 1
-                followers = cached["followers"]
-                confidence = float(cached["confidence"] or 0.2)
-                evidence = cached["evidence"]
-            else:
-                source = "wayback"
-                snapshots_fetched += 1
-                time.sleep(REQUEST_DELAY_S)
-                html, _ = fetch_snapshot_html(timestamp, original_url)
-                if html:
-                    extracted = extract_followers(html)
-                    followers = extracted["value"]
-                    confidence = extracted["confidence"] or 0.2
-                    evidence = extracted["evidence"]
-                else:
-                    followers = None
-                    confidence = 0.0
-                    evidence = None
-
-                with cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO wayback_snapshot_cache
-                        (platform, username, canonical_url, timestamp, original_url, archived_url,
-                         followers, confidence, evidence)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (platform, canonical_url, timestamp)
-                        DO UPDATE SET
-                            followers = EXCLUDED.followers,
-                            confidence = EXCLUDED.confidence,
-                            evidence = EXCLUDED.evidence,
-                            fetched_at = NOW()
-                        """,
-                        (
-                            PLATFORM_TWITTER,
-                            username,
-                            canonical_url,
-                            timestamp,
-                            original_url,
-                            archived_url,
-                            followers,
-                            confidence,
-                            evidence,
-                        ),
-                    )
 
-            with cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO wayback_job_snapshots
-                    (job_id, timestamp, archived_url, followers, confidence, evidence, source)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (job_id, timestamp) DO UPDATE SET
-                        archived_url = EXCLUDED.archived_url,
-                        followers = EXCLUDED.followers,
-                        confidence = EXCLUDED.confidence,
-                        evidence = EXCLUDED.evidence,
-                        source = EXCLUDED.source
-                    """,
-                    (
-                        job_id,
-                        timestamp,
-                        archived_url,
-                        followers,
-                        confidence,
-                        evidence,
-                        source,
-                    ),
-                )
-                processed += 1
-                if followers is not None:
-                    snapshots_with_metrics += 1
+            raw_snapshots = list_snapshots(
+                canonical_url,
+                from_year=from_year,
+                to_year=to_year,
+                from_date=from_date,
+                to_date=to_date,
+                limit=2000,
+            )
+            sampled = evenly_sample(raw_snapshots, sample=sample)
+            total = len(sampled)
+            snapshots_found = len(raw_snapshots)
+            snapshots_sampled = len(sampled)
+
+            with cursor(conn) as cur:
                 cur.execute(
-                    "UPDATE wayback_jobs SET processed = %s WHERE job_id = %s",
-                    (processed, job_id),
+                    "UPDATE wayback_jobs SET total = %s, snapshots_found = %s, snapshots_sampled = %s WHERE job_id = %s",
+                    (total, snapshots_found, snapshots_sampled, job_id),
                 )
 
-        if snapshots_sampled == 0:
-            if snapshots_found == 0:
-                summary = "No Wayback snapshots found for selected date range."
-            else:
-                summary = "No snapshots sampled (unexpected)."
-        elif snapshots_with_metrics == 0:
-            summary = "Snapshots found but no extractable metrics."
-        elif snapshots_cached == snapshots_sampled:
-            summary = "All snapshots served from cache."
-        else:
-            summary = None
-
-        with cursor() as cur:
-            cur.execute(
-                """
-                UPDATE wayback_jobs SET
-                    status = %s, finished_at = NOW(),
-                    snapshots_with_metrics = %s, snapshots_cached = %s, snapshots_fetched = %s,
-                    summary = %s
-                WHERE job_id = %s
-                """,
-                (
-                    "completed",
-                    snapshots_with_metrics,
-                    snapshots_cached,
-                    snapshots_fetched,
-                    summary,
-                    job_id,
-                ),
+            cache_map = _get_cached_by_timestamp(
+                PLATFORM_TWITTER,
+                canonical_url,
+                [s["timestamp"] for s in sampled],
+                ("followers", "confidence", "evidence"),
+                conn,
             )
 
+            # Fetch cache misses concurrently; results are consumed in order below
+            missing = [s for s in sampled if cache_map.get(s["timestamp"], {}).get("followers") is None]
+            writer = _JobWriter(job_id, PLATFORM_TWITTER, username, canonical_url, conn)
+            http = new_client()  # one keep-alive client shared by every fetch in the job
+            http.event_hooks = {"response": [_track_wayback_rate]}
+            pool, pending = _start_fetches(partial(fetch_snapshot_html, client=http), missing)
+            archived_urls = [f"{WAYBACK_PREFIX}{s['timestamp']}/{s['original']}" for s in sampled]
+            try:
+                for s, archived_url in zip(sampled, archived_urls):
+                    timestamp = s["timestamp"]
+                    original_url = s["original"]
+                    cached = cache_map.get(timestamp)
+
+                    if cached and cached.get("followers") is not None:
+                        source = "cache"
+                        to_cache = False
+                        followers = cached["followers"]
+                        confidence = float(cached["confidence"] or 0.2)
+                        evidence = cached["evidence"]
+                    else:
+                        source = "wayback"
+                        html, _ = pending[timestamp].result()
+                        if html:
+                            extracted = extract_followers(html)
+                            followers = extracted["value"]
+                            confidence = extracted["confidence"] or 0.2
+                            evidence = extracted["evidence"]
+                            to_cache = True
+                        else:
+                            # Failed fetch: leave the cache alone rather than storing an all-null row
+                            to_cache = False
+                            followers = None
+                            confidence = 0.0
+                            evidence = None
+
+                    snapshot_row = (timestamp, original_url, archived_url, followers, confidence, evidence, source)
+                    if writer.add(snapshot_row, to_cache):
+                        return
+
+                if writer.flush():
+                    return
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+                http.close()
+
+            _complete_job(job_id, PLATFORM_TWITTER, conn)
+
     except Exception as e:
         with cursor() as cur:
             cur.execute(
@@ -1060,31 +1185,21 @@ def get_cached_youtube_snapshots(input_str: str) -> Optional[dict]:
         with cursor() as cur:
             cur.execute(
                 """
-                SELECT DISTINCT ON (timestamp) timestamp, archived_url, subscribers, confidence, evidence, fetched_at
+                SELECT DISTINCT ON (timestamp) timestamp, archived_url, subscribers, confidence, evidence,
+                       MAX(fetched_at) OVER () AS last_cached_at
                 FROM wayback_snapshot_cache
                 WHERE platform = %s AND LOWER(canonical_url) = LOWER(%s)
                 ORDER BY timestamp ASC, fetched_at DESC NULLS LAST
                 """,
                 (PLATFORM_YOUTUBE, canonical_url),
             )
-            rows = [dict(r) for r in cur.fetchall()]
+            rows = cur.fetchall()
     except Exception:
         return None
     if not rows:
         return None
-    fa_values = [r.get("fetched_at") for r in rows if r.get("fetched_at")]
-    last_cached_at = max(fa_values).isoformat() if fa_values else None
-    results = [
-        {
-            "timestamp": r["timestamp"],
-            "archived_url": r.get("archived_url"),
-            "subscribers": r.get("subscribers"),
-            "confidence": float(r["confidence"]) if r.get("confidence") is not None else 0.2,
-            "evidence": r.get("evidence"),
-            "source": "cache",
-        }
-        for r in rows
-    ]
+    last_cached_at = rows[0]["last_cached_at"].isoformat() if rows[0]["last_cached_at"] else None
+    results = [_project_cached_result(r, ("subscribers",)) for r in rows]
     return {
         "platform": "youtube",
         "input": input_str.strip(),
@@ -1092,7 +1207,7 @@ def get_cached_youtube_snapshots(input_str: str) -> Optional[dict]:
         "results": results,
         "snapshots_total": len(results),
         "snapshots_sampled": len(results),
-        "notes": "Served from cache. Run a job from Explore for more snapshots.",
+        "notes": CACHED_NOTES,
         "metadata": {
             "source": "cache",
             "count": len(results),
@@ -1104,39 +1219,23 @@ def get_cached_youtube_snapshots(input_str: str) -> Optional[dict]:
 def _upsert_youtube_cache(canonical_url: str, input_str: str, results: list[dict]) -> None:
     """Upsert live fetch results into wayback_snapshot_cache. Seeds future cache reads."""
     username = (input_str or "").strip().lstrip("@").split("/")[-1].split("?")[0] or input_str
+    rows = {
+        r["timestamp"]: (
+            PLATFORM_YOUTUBE,
+            username,
+            canonical_url,
+            r["timestamp"],
+            r.get("original_url", ""),
+            r.get("archived_url"),
+            r.get("subscribers"),
+            r.get("confidence") or 0.2,
+            r.get("evidence"),
+        )
+        for r in results
+        if r.get("timestamp")
+    }
     try:
-        with cursor() as cur:
-            for r in results:
-                ts = r.get("timestamp")
-                if not ts:
-                    continue
-                archived_url = r.get("archived_url")
-                original_url = r.get("original_url", "")
-                cur.execute(
-                    """
-                    INSERT INTO wayback_snapshot_cache
-                    (platform, username, canonical_url, timestamp, original_url, archived_url,
-                     subscribers, confidence, evidence)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (platform, canonical_url, timestamp)
-                    DO UPDATE SET
-                        subscribers = EXCLUDED.subscribers,
-                        confidence = EXCLUDED.confidence,
-                        evidence = EXCLUDED.evidence,
-                        fetched_at = NOW()
-                    """,
-                    (
-                        PLATFORM_YOUTUBE,
-                        username,
-                        canonical_url,
-                        ts,
-                        original_url,
-                        archived_url,
-                        r.get("subscribers"),
-                        r.get("confidence") or 0.2,
-                        r.get("evidence"),
-                    ),
-                )
+        _copy_upsert_cache(PLATFORM_YOUTUBE, list(rows.values()))
     except Exception:
         pass  # Non-fatal; cache seeding is best-effort
 
@@ -1165,77 +1264,6 @@ def get_youtube_cache_first(input_str: str, sample: int = 40) -> dict:
     return live
 
 
-def _rows_to_snapshots_youtube(rows: list[dict]) -> list[dict]:
-    """Build normalized snapshot list from cache rows (YouTube: subscribers -> followers)."""
-    out = []
-    for r in rows:
-        ts = r.get("timestamp")
-        out.append({
-            "timestamp": _cdx_ts_to_iso(ts) if ts else "",
-            "followers": r.get("subscribers"),
-            "snapshot_url": r.get("archived_url"),
-            "raw": None,
-        })
-    return out
-
-
-def cache_first_youtube(
-    handle: str,
-    force_live: bool = False,
-    limit: Optional[int] = None,
-) -> dict:
-    """
-    Normalized cache-first: return cache only if present and not force_live;
-    else one live fetch, upsert, return. source in {cache, live, mixed}.
-    """
-    from signalmap.connectors.wayback_youtube import (
-        canonicalize_youtube_input,
-        get_youtube_archival_metrics,
-    )
-
-    handle_stripped = (handle or "").strip()
-    if not handle_stripped:
-        return _build_cache_first_response(
-            "youtube", handle, "", "live", [], 0, 0, notes=["Invalid handle."]
-        )
-    canon = canonicalize_youtube_input(handle_stripped)
-    canonical_url = canon.get("canonical_url", "")
-    if not canonical_url:
-        return _build_cache_first_response(
-            "youtube", handle_stripped, "", "live", [], 0, 0, notes=["Invalid YouTube handle or URL."]
-        )
-    sample = min(max(limit or 40, 1), 100)
-
-    cache_rows, last_cached_at = _get_cache_rows(PLATFORM_YOUTUBE, canonical_url)
-    if cache_rows and not force_live:
-        snapshots = _rows_to_snapshots_youtube(cache_rows)
-        return _build_cache_first_response(
-            "youtube", handle_stripped, canonical_url, "cache",
-            snapshots, len(cache_rows), 0,
-            last_cached_at=last_cached_at,
-        )
-
-    live = get_youtube_archival_metrics(input_str=handle_stripped, sample=sample)
-    results = live.get("results", [])
-    if results and canonical_url:
-        _upsert_youtube_cache(canonical_url, handle_stripped, results)
-    snapshots = []
-    for r in results:
-        ts = r.get("timestamp")
-        snapshots.append({
-            "timestamp": _cdx_ts_to_iso(ts) if ts else "",
-            "followers": r.get("subscribers"),
-            "snapshot_url": r.get("archived_url"),
-            "raw": None,
-        })
-    source = "mixed" if cache_rows else "live"
-    return _build_cache_first_response(
-        "youtube", handle_stripped, canonical_url, source,
-        snapshots, len(cache_rows), len(results),
-        last_cached_at=last_cached_at if cache_rows else None,
-    )
-
-
 def create_youtube_job(
     input_str: str,
     from_year: Optional[int] = None,
@@ -1278,192 +1306,107 @@ def _run_youtube_job(job_id: str) -> None:
         list_snapshots,
         evenly_sample,
         fetch_snapshot_html,
+        new_client,
         extract_subscribers,
     )
 
     try:
-        with cursor() as cur:
-            cur.execute(
-                "SELECT username, canonical_url, from_year, to_year, from_date, to_date, sample FROM wayback_jobs WHERE job_id = %s",
-                (job_id,),
-            )
-            row = cur.fetchone()
-            if not row:
-                return
-            username = row["username"]
-            canonical_url = row["canonical_url"]
-            from_year = row["from_year"]
-            to_year = row["to_year"]
-            from_date = row.get("from_date")
-            to_date = row.get("to_date")
-            sample = row["sample"]
-
-            cur.execute(
-                "UPDATE wayback_jobs SET status = %s, started_at = NOW() WHERE job_id = %s",
-                ("running", job_id),
-            )
-
-        raw_snapshots = list_snapshots(
-            canonical_url,
-            from_year=from_year,
-            to_year=to_year,
-            from_date=from_date,
-            to_date=to_date,
-            limit=2000,
-        )
-        sampled = evenly_sample(raw_snapshots, sample=sample)
-        total = len(sampled)
-        snapshots_found = len(raw_snapshots)
-        snapshots_sampled = len(sampled)
-
-        with cursor() as cur:
-            cur.execute(
-                "UPDATE wayback_jobs SET total = %s, snapshots_found = %s, snapshots_sampled = %s WHERE job_id = %s",
-                (total, snapshots_found, snapshots_sampled, job_id),
-            )
-
-        processed = 0
-        snapshots_cached = 0
-        snapshots_fetched = 0
-        snapshots_with_metrics = 0
-        for s in sampled:
-            with cursor() as cur:
+        with connection() as conn:
+            with cursor(conn) as cur:
                 cur.execute(
-                    "SELECT status FROM wayback_jobs WHERE job_id = %s",
+                    "SELECT username, canonical_url, from_year, to_year, from_date, to_date, sample FROM wayback_jobs WHERE job_id = %s",
                     (job_id,),
                 )
-                r = cur.fetchone()
-                if r and r["status"] == "canceled":
+                row = cur.fetchone()
+                if not row:
                     return
+                username = row["username"]
+                canonical_url = row["canonical_url"]
+                from_year = row["from_year"]
+                to_year = row["to_year"]
+                from_date = row.get("from_date")
+                to_date = row.get("to_date")
+                sample = row["sample"]
 
-            timestamp = s["timestamp"]
-            original_url = s["original"]
-            archived_url = f"https://web.archive.org/web/{timestamp}/{original_url}"
-
-            # Check cache
-            with cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT subscribers, confidence, evidence
-                    FROM wayback_snapshot_cache
-                    WHERE platform = %s AND canonical_url = %s AND timestamp = %s
-                    """,
-                    (PLATFORM_YOUTUBE, canonical_url, timestamp),
+                    "UPDATE wayback_jobs SET status = %s, started_at = NOW() WHERE job_id = %s",
+                    ("running", job_id),
                 )
-                cached = cur.fetchone()
-
-            if cached and cached.get("subscribers") is not None:
-                source = "cache"
-                snapshots_cached += 1
-                subscribers = cached["subscribers"]
-                confidence = float(cached["confidence"] or 0.2)
-                evidence = cached["evidence"]
-            else:
-                source = "wayback"
-                snapshots_fetched += 1
-                time.sleep(REQUEST_DELAY_S)
-                html, _ = fetch_snapshot_html(timestamp, original_url)
-                if html:
-                    extracted = extract_subscribers(html)
-                    subscribers = extracted["value"]
-                    confidence = extracted["confidence"] or 0.2
-                    evidence = extracted["evidence"]
-                else:
-                    subscribers = None
-                    confidence = 0.0
-                    evidence = None
-
-                # Upsert cache
-                with cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO wayback_snapshot_cache
-                        (platform, username, canonical_url, timestamp, original_url, archived_url,
-                         subscribers, confidence, evidence)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (platform, canonical_url, timestamp)
-                        DO UPDATE SET
-                            subscribers = EXCLUDED.subscribers,
-                            confidence = EXCLUDED.confidence,
-                            evidence = EXCLUDED.evidence,
-                            fetched_at = NOW()
-                        """,
-                        (
-                            PLATFORM_YOUTUBE,
-                            username,
-                            canonical_url,
-                            timestamp,
-                            original_url,
-                            archived_url,
-                            subscribers,
-                            confidence,
-                            evidence,
-                        ),
-                    )
 
-            # Insert job snapshot
-            with cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO wayback_job_snapshots
-                    (job_id, timestamp, archived_url, subscribers, confidence, evidence, source)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (job_id, timestamp) DO UPDATE SET
-                        archived_url = EXCLUDED.archived_url,
-                        subscribers = EXCLUDED.subscribers,
-                        confidence = EXCLUDED.confidence,
-                        evidence = EXCLUDED.evidence,
-                        source = EXCLUDED.source
-                    """,
-                    (
-                        job_id,
-                        timestamp,
-                        archived_url,
-                        subscribers,
-                        confidence,
-                        evidence,
-                        source,
-                    ),
-                )
-                processed += 1
-                if subscribers is not None:
-                    snapshots_with_metrics += 1
+            raw_snapshots = list_snapshots(
+                canonical_url,
+                from_year=from_year,
+                to_year=to_year,
+                from_date=from_date,
+                to_date=to_date,
+                limit=2000,
+            )
+            sampled = evenly_sample(raw_snapshots, sample=sample)
+            total = len(sampled)
+            snapshots_found = len(raw_snapshots)
+            snapshots_sampled = len(sampled)
+
+            with cursor(conn) as cur:
                 cur.execute(
-                    "UPDATE wayback_jobs SET processed = %s WHERE job_id = %s",
-                    (processed, job_id),
+                    "UPDATE wayback_jobs SET total = %s, snapshots_found = %s, snapshots_sampled = %s WHERE job_id = %s",
+                    (total, snapshots_found, snapshots_sampled, job_id),
                 )
 
-        if snapshots_sampled == 0:
-            if snapshots_found == 0:
-                summary = "No Wayback snapshots found for selected date range."
-            else:
-                summary = "No snapshots sampled (unexpected)."
-        elif snapshots_with_metrics == 0:
-            summary = "Snapshots found but no extractable metrics."
-        elif snapshots_cached == snapshots_sampled:
-            summary = "All snapshots served from cache."
-        else:
-            summary = None
-
-        with cursor() as cur:
-            cur.execute(
-                """
-                UPDATE wayback_jobs SET
-                    status = %s, finished_at = NOW(),
-                    snapshots_with_metrics = %s, snapshots_cached = %s, snapshots_fetched = %s,
-                    summary = %s
-                WHERE job_id = %s
-                """,
-                (
-                    "completed",
-                    snapshots_with_metrics,
-                    snapshots_cached,
-                    snapshots_fetched,
-                    summary,
-                    job_id,
-                ),
+            cache_map = _get_cached_by_timestamp(
+                PLATFORM_YOUTUBE,
+                canonical_url,
+                [s["timestamp"] for s in sampled],
+                ("subscribers", "confidence", "evidence"),
+                conn,
             )
 
+            # Fetch cache misses concurrently; results are consumed in order below
+            missing = [s for s in sampled if cache_map.get(s["timestamp"], {}).get("subscribers") is None]
+            writer = _JobWriter(job_id, PLATFORM_YOUTUBE, username, canonical_url, conn)
+            http = new_client()  # one keep-alive client shared by every fetch in the job
+            http.event_hooks = {"response": [_track_wayback_rate]}
+            pool, pending = _start_fetches(partial(fetch_snapshot_html, client=http), missing)
+            archived_urls = [f"{WAYBACK_PREFIX}{s['timestamp']}/{s['original']}" for s in sampled]
+            try:
+                for s, archived_url in zip(sampled, archived_urls):
+                    timestamp = s["timestamp"]
+                    original_url = s["original"]
+                    cached = cache_map.get(timestamp)
+
+                    if cached and cached.get("subscribers") is not None:
+                        source = "cache"
+                        to_cache = False
+                        subscribers = cached["subscribers"]
+                        confidence = float(cached["confidence"] or 0.2)
+                        evidence = cached["evidence"]
+                    else:
+                        source = "wayback"
+                        html, _ = pending[timestamp].result()
+                        if html:
+                            extracted = extract_subscribers(html)
+                            subscribers = extracted["value"]
+                            confidence = extracted["confidence"] or 0.2
+                            evidence = extracted["evidence"]
+                            to_cache = True
+                        else:
+                            # Failed fetch: leave the cache alone rather than storing an all-null row
+                            to_cache = False
+                            subscribers = None
+                            confidence = 0.0
+                            evidence = None
+
+                    snapshot_row = (timestamp, original_url, archived_url, subscribers, confidence, evidence, source)
+                    if writer.add(snapshot_row, to_cache):
+                        return
+
+                if writer.flush():
+                    return
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+                http.close()
+
+            _complete_job(job_id, PLATFORM_YOUTUBE, conn)
+
     except Exception as e:
         with cursor() as cur:
             cur.execute(
@@ -1472,6 +1415,192 @@ def _run_youtube_job(job_id: str) -> None:
             )
 
 
+# --- Cache-first (all platforms) ---
+
+
+def _resolve_instagram(handle: str) -> tuple[str, str]:
+    handle_norm = _normalize_instagram_username(handle)
+    return handle_norm, f"https://www.instagram.com/{handle_norm}/" if handle_norm else ""
+
+
+def _resolve_twitter(handle: str) -> tuple[str, str]:
+    from signalmap.connectors.wayback_twitter import normalize_username
+
+    return normalize_username(handle)
+
+
+def _resolve_youtube(handle: str) -> tuple[str, str]:
+    from signalmap.connectors.wayback_youtube import canonicalize_youtube_input
+
+    return handle, canonicalize_youtube_input(handle).get("canonical_url", "")
+
+
+def _live_instagram(handle: str, sample: int) -> dict:
+    return get_instagram_archival_metrics(
+        username=handle, sample=sample, include_evidence=True, progress=False,
+    )
+
+
+def _live_twitter(handle: str, sample: int) -> dict:
+    from signalmap.connectors.wayback_twitter import get_twitter_archival_metrics
+
+    return get_twitter_archival_metrics(username=handle, from_year=2009, to_year=2026, sample=sample)
+
+
+def _live_youtube(handle: str, sample: int) -> dict:
+    from signalmap.connectors.wayback_youtube import get_youtube_archival_metrics
+
+    return get_youtube_archival_metrics(input_str=handle, sample=sample)
+
+
+# Per-platform pieces of cache-first reads and job result merging.
+# resolve(handle) -> (display handle, canonical_url); live(handle, sample); upsert(handle, canonical_url, results);
+# run(job_id) executes a queued job.
+_PLATFORMS: dict[str, dict] = {
+    PLATFORM: {
+        "resolve": _resolve_instagram,
+        "invalid_note": "Invalid handle.",
+        "live": _live_instagram,
+        "run": _run_instagram_job,
+        "upsert": lambda handle, canonical_url, results: _upsert_instagram_cache(handle, results),
+        "follower_key": "followers",
+        "metric_keys": ("followers", "following", "posts"),
+    },
+    PLATFORM_TWITTER: {
+        "resolve": _resolve_twitter,
+        "invalid_note": "Invalid Twitter handle or URL.",
+        "live": _live_twitter,
+        "run": _run_twitter_job,
+        "upsert": _upsert_twitter_cache,
+        "follower_key": "followers",
+        "metric_keys": ("followers",),
+    },
+    PLATFORM_YOUTUBE: {
+        "resolve": _resolve_youtube,
+        "invalid_note": "Invalid YouTube handle or URL.",
+        "live": _live_youtube,
+        "run": _run_youtube_job,
+        "upsert": lambda handle, canonical_url, results: _upsert_youtube_cache(canonical_url, handle, results),
+        "follower_key": "subscribers",
+        "metric_keys": ("subscribers",),
+    },
+}
+
+
+def claim_queued_job() -> Optional[tuple[str, str]]:
+    """
+    Atomically take the oldest queued job and mark it running. Returns (job_id, platform) or None.
+    SKIP LOCKED lets any number of worker processes poll the same table without double-claiming.
+    """
+    with cursor() as cur:
+        cur.execute(
+            """
+            UPDATE wayback_jobs SET status = 'running', started_at = NOW()
+            WHERE job_id = (
+                SELECT job_id FROM wayback_jobs WHERE status = 'queued'
+                ORDER BY created_at LIMIT 1 FOR UPDATE SKIP LOCKED
+            )
+            RETURNING job_id, platform
+            """
+        )
+        row = cur.fetchone()
+    return (str(row["job_id"]), row["platform"]) if row else None
+
+
+def _fail_claimed_job(job_id: str, error: Exception) -> None:
+    """Mark a claimed job failed when its runner raised instead of recording the failure itself."""
+    with cursor() as cur:
+        cur.execute(
+            "UPDATE wayback_jobs SET status = %s, error = %s, finished_at = NOW() WHERE job_id = %s AND status = 'running'",
+            ("failed", str(error), job_id),
+        )
+
+
+def work_queued_jobs(stop: Optional[threading.Event] = None) -> None:
+    """
+    Worker loop for job_worker.py: claim and run queued jobs until stop is set.
+    An error (DB down, pool exhausted, runner crash) is logged and retried after a doubling wait,
+    so the thread never dies; a job whose runner raised is marked failed instead of left running.
+    """
+    stop = stop or threading.Event()
+    backoff = JOB_POLL_INTERVAL_S
+    while not stop.is_set():
+        claimed = None
+        try:
+            claimed = claim_queued_job()
+            if claimed is None:
+                backoff = JOB_POLL_INTERVAL_S
+                stop.wait(JOB_POLL_INTERVAL_S)
+                continue
+            job_id, platform = claimed
+            _PLATFORMS[platform]["run"](job_id)
+            backoff = JOB_POLL_INTERVAL_S
+        except Exception as e:
+            logger.exception("Wayback job worker iteration failed (job %s)", claimed[0] if claimed else None)
+            if claimed is not None:
+                try:
+                    _fail_claimed_job(claimed[0], e)
+                except Exception:
+                    logger.exception("Could not mark job %s failed", claimed[0])
+            stop.wait(backoff)
+            backoff = min(backoff * 2, JOB_WORKER_MAX_BACKOFF_S)
+
+
+def cache_first(
+    platform: str,
+    handle: str,
+    force_live: bool = False,
+    limit: Optional[int] = None,
+) -> dict:
+    """
+    Normalized cache-first: return cache only if present and not force_live;
+    else one live fetch, upsert, return. source in {cache, live, mixed}.
+    """
+    spec = _PLATFORMS[platform]
+    handle_stripped = (handle or "").strip()
+    if not handle_stripped:
+        return _build_cache_first_response(
+            platform, handle, "", "live", [], 0, 0, notes=["Invalid handle."]
+        )
+    display_handle, canonical_url = spec["resolve"](handle_stripped)
+    if not canonical_url:
+        return _build_cache_first_response(
+            platform, handle_stripped, "", "live", [], 0, 0, notes=[spec["invalid_note"]]
+        )
+    sample = min(max(limit or 40, 1), 100)
+    follower_key = spec["follower_key"]
+
+    # limit only sizes the live sample; every cached row is returned so the newest data stays on the chart
+    cache_rows, last_cached_at = _get_cache_rows(
+        platform, canonical_url, fields=("timestamp", "archived_url", follower_key)
+    )
+    if cache_rows and not force_live:
+        snapshots = _rows_to_snapshots(cache_rows, follower_key)
+        return _build_cache_first_response(
+            platform, display_handle, canonical_url, "cache",
+            snapshots, len(cache_rows), 0,
+            last_cached_at=last_cached_at,
+        )
+
+    # One live batch (no retries)
+    live = spec["live"](display_handle, sample)
+    results = live.get("results", [])
+    if results:
+        spec["upsert"](display_handle, canonical_url, results)
+    snapshots = _rows_to_snapshots(results, follower_key)
+    source = "mixed" if cache_rows else "live"
+    return _build_cache_first_response(
+        platform, display_handle, canonical_url, source,
+        snapshots, len(cache_rows), len(results),
+        last_cached_at=last_cached_at if cache_rows else None,
+    )
+
+
+cache_first_instagram = partial(cache_first, PLATFORM)
+cache_first_twitter = partial(cache_first, PLATFORM_TWITTER)
+cache_first_youtube = partial(cache_first, PLATFORM_YOUTUBE)
+
+
 # --- YouTube Data API v3 channel snapshots (cache-first) ---
 
 def get_cached_youtube_channel_snapshots(
@@ -1,35 +1,80 @@
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import re
 import sys
+from bisect import bisect_left, bisect_right
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qsl
 
 from dotenv import load_dotenv
 
 load_dotenv()
+# Read once; the env does not change after startup and the jobs endpoints check this per request
+_DB_CONFIGURED = bool(os.getenv("DATABASE_URL"))
 
 log = logging.getLogger(__name__)
 
 # Allow signalmap package imports (apps/api/src/signalmap)
 sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
 
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
-from fastapi import BackgroundTasks, Body, FastAPI, HTTPException, Query, Request
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request, Response
 
-from connectors.wayback import get_snapshots_with_metrics
+import httpx
+from cachetools import TTLCache
+
+from connectors.wayback import aget_snapshots_with_metrics
+from signalmap.data.load_events import get_events_by_layers, load_events
+from signalmap.services.signals import (
+    get_brent_series,
+    get_gold_price_global_series,
+    get_oil_export_capacity_study,
+    get_oil_global_long_series,
+    get_oil_ppp_iran_series,
+    get_oil_ppp_turkey_series,
+    get_real_oil_series,
+    get_usd_toman_series,
+)
 from connectors.wayback_instagram import (
-    get_instagram_archival_metrics,
-    get_instagram_followers_time_series,
-    list_snapshots,
+    aget_instagram_archival_metrics,
+    aget_instagram_followers_time_series,
+    aiter_instagram_archival_metrics,
+    alist_snapshots,
     deduplicate_snapshots,
     evenly_sample_snapshots,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    class DefaultResponse(ORJSONResponse):
+        """ORJSONResponse that also accepts naive datetimes (as UTC) and numpy scalars/arrays."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:  # orjson optional; stdlib JSON is the fallback
+    from fastapi.responses import JSONResponse as DefaultResponse
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis optional; without it the Wayback response cache is per-process only
+    aioredis = None
 from signalmap.connectors.wayback_youtube import get_youtube_archival_metrics
 from signalmap.connectors.youtube import fetch_channel, test_youtube_api
 from signalmap.services.comment_analysis import (
@@ -50,6 +95,10 @@ from signalmap.utils.youtube_resolver import resolve_channel_id
 from signalmap.connectors.wayback_twitter import get_twitter_archival_metrics
 
 from db import (
+    DB_BREAKER,
+    DB_UNAVAILABLE_ERRORS,
+    CircuitOpenError,
+    close_pool,
     cursor,
     delete_youtube_comment_analysis,
     get_cached_youtube_comment_analysis,
@@ -67,10 +116,12 @@ from jobs import (
     get_cached_youtube_channel_snapshots,
     get_job,
     get_job_results,
+    iter_job_results,
     list_jobs,
     cancel_job,
     delete_job,
     get_youtube_channel_cache_first,
+    submit_job,
     _run_instagram_job,
     _run_youtube_job,
     _run_twitter_job,
@@ -123,12 +174,33 @@ def resolve_handle(
     )
 
 
-app = FastAPI()
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Schema setup is blocking psycopg2 DDL; keep it off the event loop. It also opens the DB pool,
+    # so the first requests find warm connections.
+    await run_in_threadpool(init_tables)
+    # Shared client for the async Wayback endpoints; connections are pooled across requests.
+    # Transport retries cover connect failures only (archive.org drops handshakes under load).
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        ),
+    )
+    # Optional shared cache so every worker/replica reuses the same Wayback responses
+    redis_url = os.getenv("REDIS_URL")
+    app.state.redis = aioredis.from_url(redis_url) if aioredis and redis_url else None
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+        await run_in_threadpool(close_pool)
 
 
-@app.on_event("startup")
-def startup():
-    init_tables()
+app = FastAPI(lifespan=_lifespan, default_response_class=DefaultResponse)
 
 allowed_origins = [
     "http://localhost:3000",
@@ -139,51 +211,142 @@ web_origin = os.getenv("WEB_ORIGIN")
 if web_origin:
     allowed_origins.append(web_origin)
 
+
+class _CORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with a frozenset lookup for exact origins before the (precompiled) Railway regex."""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self._exact_origins = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if origin in self._exact_origins:
+            return True
+        return self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin) is not None
+
+
 app.add_middleware(
-    CORSMiddleware,
+    _CORSMiddleware,
     allow_origins=allowed_origins,
     allow_origin_regex=r"https://.*\.(up\.railway\.app|railway\.app)",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=7200,  # browsers cache preflights up to 2h (Chromium's cap); default 600 re-sends OPTIONS often
 )
 
 
+class _ETagMiddleware:
+    """
+    Weak ETag on GET 200 responses with a known length (one body chunk); a matching If-None-Match
+    gets 304 with no body. Streaming responses pass through. Sits inside GZip, so it hashes the
+    uncompressed body (hence weak: the same tag covers both encodings).
+    Read-only data routes also get a shared Cache-Control so browsers and the edge can reuse them,
+    unless the request asks to bypass caches (?nocache=true) or the route sets its own Cache-Control.
+    """
+
+    _DROP_ON_304 = (b"content-length", b"content-type")
+    # Upstream series change at most daily; event data and the overview stub only on deploy
+    _CACHEABLE_PREFIXES = ("/api/signals/", "/api/overview", "/api/events")
+    _CACHE_CONTROL = b"public, max-age=3600, stale-while-revalidate=86400"
+    _FALSE_VALUES = ("", "0", "false", "f", "no", "n", "off")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        if_none_match = next((v for k, v in scope["headers"] if k == b"if-none-match"), None)
+        cacheable = scope["path"].startswith(self._CACHEABLE_PREFIXES) and not any(
+            k == "nocache" and v.lower() not in self._FALSE_VALUES
+            for k, v in parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        )
+        start = None
+
+        async def send_with_etag(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                names = {k.lower() for k, _ in headers}
+                if cacheable and message["status"] == 200 and b"cache-control" not in names:
+                    message = {**message, "headers": list(headers) + [(b"cache-control", self._CACHE_CONTROL)]}
+                if message["status"] == 200 and b"content-length" in names and b"etag" not in names:
+                    start = message  # hold until the body is known
+                    return
+            elif message["type"] == "http.response.body" and start is not None:
+                held, start = start, None
+                body = message.get("body", b"")
+                if message.get("more_body"):  # multi-chunk body: don't buffer, send untagged
+                    await send(held)
+                    await send(message)
+                    return
+                etag = b'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+                if if_none_match is not None and (
+                    if_none_match.strip() == b"*" or etag in (t.strip() for t in if_none_match.split(b","))
+                ):
+                    headers = [(k, v) for k, v in held["headers"] if k.lower() not in self._DROP_ON_304]
+                    await send({"type": "http.response.start", "status": 304, "headers": headers + [(b"etag", etag)]})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                await send({**held, "headers": list(held["headers"]) + [(b"etag", etag)]})
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
+app.add_middleware(_ETagMiddleware)
+# Snapshot/series JSON is repetitive and compresses ~8-10x; level 5 keeps per-request CPU low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+def _static_json(content: dict) -> bytes:
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Fixed bodies for index/health/version, encoded once; async handlers skip the threadpool hop
+_ROOT_JSON = _static_json({"name": "signalmap-api", "status": "ok"})
+_API_INDEX_JSON = _static_json({
+    "endpoints": {
+        "overview": "/api/overview?study_id=1",
+        "wayback_snapshots": "/api/wayback/snapshots?url=...&sample=30",
+        "wayback_instagram": "/api/wayback/instagram?username=...&sample=30",
+        "wayback_youtube": "/api/wayback/youtube?input=@handle&from_year=2010&to_year=2026&sample=40",
+        "wayback_twitter": "/api/wayback/twitter?username=jack&from_year=2009&to_year=2026&sample=40",
+        "wayback_instagram_jobs": "POST /api/wayback/instagram/jobs",
+        "wayback_jobs_list": "GET /api/wayback/jobs/list",
+        "wayback_job_status": "GET /api/wayback/jobs/{job_id}",
+        "youtube_transcript": "POST /api/youtube/transcript",
+        "youtube_transcript_analyze": "POST /api/youtube/transcript/analyze",
+        "transcript_analyze_text": "POST /api/transcript/analyze-text",
+    },
+    "docs": "/docs",
+})
+_HEALTH_JSON = _static_json({"status": "ok"})
+_VERSION_JSON = _static_json({"version": "jobs-v1", "has_jobs": True})
+
+
 @app.get("/")
-def root():
-    return {"name": "signalmap-api", "status": "ok"}
+async def root():
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/api")
-def api_index():
+async def api_index():
     """List available API endpoints."""
-    return {
-        "endpoints": {
-            "overview": "/api/overview?study_id=1",
-            "wayback_snapshots": "/api/wayback/snapshots?url=...&sample=30",
-            "wayback_instagram": "/api/wayback/instagram?username=...&sample=30",
-            "wayback_youtube": "/api/wayback/youtube?input=@handle&from_year=2010&to_year=2026&sample=40",
-            "wayback_twitter": "/api/wayback/twitter?username=jack&from_year=2009&to_year=2026&sample=40",
-            "wayback_instagram_jobs": "POST /api/wayback/instagram/jobs",
-            "wayback_jobs_list": "GET /api/wayback/jobs/list",
-            "wayback_job_status": "GET /api/wayback/jobs/{job_id}",
-            "youtube_transcript": "POST /api/youtube/transcript",
-            "youtube_transcript_analyze": "POST /api/youtube/transcript/analyze",
-            "transcript_analyze_text": "POST /api/transcript/analyze-text",
-        },
-        "docs": "/docs",
-    }
+    return Response(content=_API_INDEX_JSON, media_type="application/json")
 
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
 @app.get("/api/version")
-def api_version():
+async def api_version():
     """Debug: verify API has jobs support."""
-    return {"version": "jobs-v1", "has_jobs": True}
+    return Response(content=_VERSION_JSON, media_type="application/json")
 
 
 @app.get("/api/market/brent-current")
@@ -279,7 +442,7 @@ def cron_oil_economy_production():
 
 
 @app.get("/api/events")
-def get_events(
+async def get_events(
     study_id: str = "1",
     layers: Optional[str] = Query(
         None,
@@ -287,14 +450,11 @@ def get_events(
     ),
 ):
     """Return contextual events for a study. Events are exogenous anchors, not outcome variables."""
-    from signalmap.data.load_events import load_events, get_events_by_layers
-
     if layers:
         layer_list = [s.strip() for s in layers.split(",") if s.strip()]
         events = get_events_by_layers(study_id, layer_list)
         if "opec_decisions" in layer_list:
             opec_count = sum(1 for e in events if e.get("layer") == "opec_decisions")
-            import sys
             print(f"[events] layers={layer_list} study_id={study_id} events={len(events)} opec={opec_count}", file=sys.stderr)
     else:
         events = load_events(study_id)
@@ -349,15 +509,42 @@ OVERVIEW_STUB = {
 }
 
 
+# Timeline dates (the stub is in date order), parallel to OVERVIEW_STUB["timeline"], so event windows are bisect slices
+_TIMELINE_DATES: tuple[str, ...] = tuple(p["date"] for p in OVERVIEW_STUB["timeline"])
+
+# Default overview body minus the per-request fields, encoded once (same separators as JSONResponse)
+_OVERVIEW_JSON_TITLE = (',"study_title":' + json.dumps(OVERVIEW_STUB["study_title"], ensure_ascii=False)).encode("utf-8")
+_OVERVIEW_JSON_TAIL = json.dumps(
+    {"kpis": OVERVIEW_STUB["kpis"], "timeline": OVERVIEW_STUB["timeline"]},
+    ensure_ascii=False,
+    separators=(",", ":"),
+)[1:].encode("utf-8")
+
+
+@lru_cache(maxsize=2)
+def _overview_json_suffix(today: str) -> bytes:
+    """time_range + kpis/timeline bytes; only the end date changes, once a day."""
+    time_range = json.dumps(["2021-01-15", today], separators=(",", ":")).encode("utf-8")
+    return b',"time_range":' + time_range + b"," + _OVERVIEW_JSON_TAIL
+
+
+@lru_cache(maxsize=64)
+def _overview_json(study_id: str, today: str) -> bytes:
+    """Full default overview body per study; bounded LRU since study_id comes from the query string."""
+    return (
+        b'{"study_id":'
+        + json.dumps(study_id, ensure_ascii=False).encode("utf-8")
+        + _OVERVIEW_JSON_TITLE
+        + _overview_json_suffix(today)
+    )
+
+
 def _filter_overview_by_event(
     study_id: str,
     anchor_event_id: str,
     window_days: int,
 ) -> dict:
     """Filter timeline and recompute KPIs for an event-centered window."""
-    from datetime import datetime, timedelta
-    from signalmap.data.load_events import load_events
-
     events = load_events(study_id)
     event = next((e for e in events if e.get("id") == anchor_event_id), None)
     if not event:
@@ -369,7 +556,7 @@ def _filter_overview_by_event(
     end = (event_date + delta).strftime("%Y-%m-%d")
 
     timeline = OVERVIEW_STUB["timeline"]
-    filtered = [p for p in timeline if start <= p["date"] <= end]
+    filtered = timeline[bisect_left(_TIMELINE_DATES, start):bisect_right(_TIMELINE_DATES, end)]
     if not filtered:
         return {**OVERVIEW_STUB, "study_id": study_id}
 
@@ -391,70 +578,129 @@ def _filter_overview_by_event(
     }
 
 
-def _validate_date(s: str) -> bool:
-    """Check YYYY-MM-DD format."""
-    if len(s) != 10 or s[4] != "-" or s[7] != "-":
-        return False
+# fromisoformat also takes YYYYMMDD and week dates, so the shape is checked first
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(s: str) -> Optional[date]:
+    """Parse YYYY-MM-DD, or None if malformed. Cached: clients repeat the same few ranges."""
+    if not _ISO_DATE.fullmatch(s):
+        return None
     try:
-        from datetime import datetime
-        datetime.strptime(s, "%Y-%m-%d")
-        return True
+        return date.fromisoformat(s)
     except ValueError:
-        return False
+        return None
 
 
-@app.get("/api/signals/oil/brent")
-def get_brent_oil_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return Brent crude oil price (FRED DCOILBRENTEU) for date range."""
-    if not _validate_date(start) or not _validate_date(end):
+def _check_range(start: str, end: str) -> None:
+    """400 unless start and end are YYYY-MM-DD dates with start <= end."""
+    s, e = _parse_date(start), _parse_date(end)
+    if s is None or e is None:
         raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
+    if s > e:
         raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_brent_series
-        return get_brent_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
 
 
-@app.get("/api/signals/gold/global")
-def get_gold_price_global_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return global gold price (USD/oz). Annual data only."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_gold_price_global_series
-        return get_gold_price_global_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
+# Shared (Redis) cache for deterministic (start, end) signals, TTL by data cadence. The services keep
+# their own per-process caches; this lets every worker/replica and restarts reuse one computation.
+async def _cached_signal(
+    signal: str, ttl: int, start: str, end: str, compute: Callable[[str, str], dict]
+) -> dict:
+    """Redis hit, else compute(start, end) on the threadpool and store it; compute errors become 502."""
+    key = f"signal:{signal}:{start}:{end}"
+    out = await _redis_get(key)
+    if out is not None:
+        return out
 
+    async def miss() -> dict:
+        try:
+            out = await run_in_threadpool(compute, start, end)
+        except Exception as e:
+            log.exception("signal fetch failed")
+            raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
+        await _redis_set(key, out, ttl)
+        return out
 
-@app.get("/api/signals/oil/real")
-def get_real_oil_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return inflation-adjusted (real) oil price in constant 2015 USD/bbl."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_real_oil_series
-        return get_real_oil_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
+    return await _single_flight(key, miss)
+
+
+# Signals that are a pure function of (start, end): one handler, registered per path.
+# path -> (operation name, cache key, service, Redis TTL seconds, summary)
+_CACHED_SIGNAL_ROUTES: dict[str, tuple[str, str, Callable[[str, str], dict], int, str]] = {
+    "/api/signals/oil/brent": (
+        "get_brent_oil_signal",
+        "brent_oil_price",
+        get_brent_series,
+        21600,
+        "Return Brent crude oil price (FRED DCOILBRENTEU) for date range.",
+    ),
+    "/api/signals/gold/global": (
+        "get_gold_price_global_signal",
+        "gold_price_global",
+        get_gold_price_global_series,
+        86400,
+        "Return global gold price (USD/oz). Annual data only.",
+    ),
+    "/api/signals/oil/real": (
+        "get_real_oil_signal",
+        "real_oil_price",
+        get_real_oil_series,
+        21600,
+        "Return inflation-adjusted (real) oil price in constant 2015 USD/bbl.",
+    ),
+    "/api/signals/oil/ppp-iran": (
+        "get_oil_ppp_iran_signal",
+        "oil_price_ppp_iran",
+        get_oil_ppp_iran_series,
+        86400,
+        "Return Iran PPP-adjusted oil price burden (annual).",
+    ),
+    "/api/signals/oil/ppp-turkey": (
+        "get_oil_ppp_turkey_signal",
+        "oil_price_ppp_turkey",
+        get_oil_ppp_turkey_series,
+        86400,
+        "Return Turkey PPP-adjusted oil price burden (annual). Same methodology as Iran.",
+    ),
+    "/api/signals/oil/export-capacity": (
+        "get_oil_export_capacity_signal",
+        "oil_export_capacity",
+        get_oil_export_capacity_study,
+        86400,
+        "Return oil price, Iran export volume, and export revenue proxy for Study 9.",
+    ),
+    "/api/signals/oil/global-long": (
+        "get_oil_global_long_signal",
+        "oil_global_long",
+        get_oil_global_long_series,
+        86400,
+        "Return long-range oil: annual (EIA) pre-1987, daily (Brent) from 1987-05-20.",
+    ),
+    "/api/signals/fx/usd-toman": (
+        "get_usd_toman_signal",
+        "usd_toman_open_market",
+        get_usd_toman_series,
+        3600,
+        "Return USD→Toman open-market merge (archive + Bonbast + FRED pre-archive) and optional official annual (WDI).",
+    ),
+}
+
+
+def _cached_signal_endpoint(signal: str, ttl: int, compute: Callable[[str, str], dict], doc: str):
+    async def endpoint(
+        start: str = Query(..., description="Start date YYYY-MM-DD"),
+        end: str = Query(..., description="End date YYYY-MM-DD"),
+    ):
+        _check_range(start, end)
+        return await _cached_signal(signal, ttl, start, end, compute)
+
+    endpoint.__doc__ = doc
+    return endpoint
+
+
+for _path, (_name, _signal, _compute, _ttl, _doc) in _CACHED_SIGNAL_ROUTES.items():
+    app.add_api_route(_path, _cached_signal_endpoint(_signal, _ttl, _compute, _doc), methods=["GET"], name=_name)
 
 
 @app.get("/api/signals/fred/us-cpi-monthly")
@@ -463,10 +709,7 @@ def get_us_cpi_monthly_signal(
     end: str = Query(..., description="End date YYYY-MM-DD"),
 ):
     """US CPIAUCSL monthly (1982-84=100), trimmed for client-side USD deflation."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_us_cpi_monthly_series
         return get_us_cpi_monthly_series(start, end)
@@ -475,42 +718,6 @@ def get_us_cpi_monthly_signal(
         raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
 
 
-@app.get("/api/signals/oil/ppp-iran")
-def get_oil_ppp_iran_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return Iran PPP-adjusted oil price burden (annual)."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_oil_ppp_iran_series
-        return get_oil_ppp_iran_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
-
-
-@app.get("/api/signals/oil/ppp-turkey")
-def get_oil_ppp_turkey_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return Turkey PPP-adjusted oil price burden (annual). Same methodology as Iran."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_oil_ppp_turkey_series
-        return get_oil_ppp_turkey_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
-
-
 @app.get("/api/signals/wdi/gini-comparison")
 def get_wdi_gini_comparison_signal(
     start: str | None = Query(None, description="Start date YYYY-MM-DD (year from first 4 chars)"),
@@ -521,10 +728,7 @@ def get_wdi_gini_comparison_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_gini_inequality_comparison
 
@@ -548,10 +752,7 @@ def get_wdi_cpi_inflation_yoy_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_cpi_inflation_yoy_comparison
 
@@ -571,10 +772,7 @@ def get_wdi_gdp_global_comparison_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_gdp_global_comparison
 
@@ -594,10 +792,7 @@ def get_wdi_isi_diagnostics_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_isi_diagnostics
 
@@ -621,10 +816,7 @@ def get_wdi_poverty_headcount_iran_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_poverty_headcount_iran
 
@@ -644,10 +836,7 @@ def get_wdi_iran_money_supply_m2_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_iran_money_supply_m2
 
@@ -667,10 +856,7 @@ def get_wdi_iran_external_debt_signal(
         start = "1970-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_iran_external_debt
 
@@ -690,10 +876,7 @@ def get_wdi_iran_demand_nominal_usd_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_iran_demand_nominal_usd
 
@@ -713,10 +896,7 @@ def get_wdi_dutch_disease_diagnostics_iran_signal(
         start = "1970-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_dutch_disease_diagnostics_iran
 
@@ -741,10 +921,7 @@ def get_wdi_country_economy_bundle_signal(
         start = "1960-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     iso = (iso3 or "").strip().upper()
     if len(iso) != 3 or not iso.isalpha():
         raise HTTPException(status_code=400, detail="iso3 must be a 3-letter country code")
@@ -767,10 +944,7 @@ def get_us_living_standards_bundle_signal(
         start = "1970-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_us_living_standards_bundle
 
@@ -791,10 +965,7 @@ def get_oil_production_exporters_signal(
         start = "2000-01-01"
     if end is None:
         end = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_oil_production_exporters_series
         result = get_oil_production_exporters_series(start, end, nocache=nocache)
@@ -807,34 +978,13 @@ def get_oil_production_exporters_signal(
         raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
 
 
-@app.get("/api/signals/oil/export-capacity")
-def get_oil_export_capacity_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return oil price, Iran export volume, and export revenue proxy for Study 9."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_oil_export_capacity_study
-        return get_oil_export_capacity_study(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
-
-
 @app.get("/api/signals/oil/economy-overview")
 def get_oil_economy_overview_signal(
     start: str = Query(..., description="Start date YYYY-MM-DD"),
     end: str = Query(..., description="End date YYYY-MM-DD"),
 ):
     """Iran: annual production, Brent price, estimated revenue (production × Brent)."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_oil_economy_overview_iran
         return get_oil_economy_overview_iran(start, end)
@@ -843,24 +993,6 @@ def get_oil_economy_overview_signal(
         raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
 
 
-@app.get("/api/signals/oil/global-long")
-def get_oil_global_long_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return long-range oil: annual (EIA) pre-1987, daily (Brent) from 1987-05-20."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_oil_global_long_series
-        return get_oil_global_long_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
-
-
 def _oil_trade_fallback(start_year: int, end_year: int) -> dict:
     """Curated fallback when oil_trade_network service unavailable."""
     try:
@@ -895,34 +1027,13 @@ def api_oil_trade_network(
             raise HTTPException(status_code=502, detail=f"Oil trade fetch failed: {e}")
 
 
-@app.get("/api/signals/fx/usd-toman")
-def get_usd_toman_signal(
-    start: str = Query(..., description="Start date YYYY-MM-DD"),
-    end: str = Query(..., description="End date YYYY-MM-DD"),
-):
-    """Return USD→Toman open-market merge (archive + Bonbast + FRED pre-archive) and optional official annual (WDI)."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
-    try:
-        from signalmap.services.signals import get_usd_toman_series
-        return get_usd_toman_series(start, end)
-    except Exception as e:
-        log.exception("signal fetch failed")
-        raise HTTPException(status_code=502, detail=f"Signal fetch failed: {e}")
-
-
 @app.get("/api/signals/fx/usd-irr-dual")
 def get_usd_irr_dual_signal(
     start: str = Query(..., description="Start date YYYY-MM-DD"),
     end: str = Query(..., description="End date YYYY-MM-DD"),
 ):
     """Return official (World Bank WDI FCRF + FRED PWT backfill) and open-market (Bonbast + rial archive, no FRED)."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_usd_irr_dual_series
         return get_usd_irr_dual_series(start, end)
@@ -937,10 +1048,7 @@ def get_iran_wage_cpi_signal(
     end: str = Query(..., description="End date YYYY-MM-DD"),
 ):
     """Return Iran nominal minimum wage and CPI (annual) for real wage study."""
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     try:
         from signalmap.services.signals import get_iran_wage_cpi_series
         return get_iran_wage_cpi_series(start, end)
@@ -968,10 +1076,7 @@ def get_gdp_composition_signal(
     If ``start`` is earlier than coverage, points begin at the earliest year any of the
     three indicators has data (see ``data_span`` in the response).
     """
-    if not _validate_date(start) or not _validate_date(end):
-        raise HTTPException(status_code=400, detail="Invalid date format (use YYYY-MM-DD)")
-    if start > end:
-        raise HTTPException(status_code=400, detail="start must be <= end")
+    _check_range(start, end)
     if levels_value_type == "toman" and country.strip().upper() != "IRN":
         raise HTTPException(
             status_code=400,
@@ -993,13 +1098,24 @@ def _today_iso() -> str:
     return date.today().strftime("%Y-%m-%d")
 
 
+def _clamped(lo: int, hi: int) -> AfterValidator:
+    return AfterValidator(lambda v: min(max(v, lo), hi))
+
+
+# Wayback sample sizes; out-of-range values are clamped (not rejected) during validation
+SampleSmall = Annotated[int, _clamped(1, 50)]
+SampleLarge = Annotated[int, _clamped(1, 100)]
+
+
 @app.get("/api/overview")
-def get_overview(
+async def get_overview(
     study_id: str = "1",
     anchor_event_id: Optional[str] = None,
     window_days: Optional[int] = None,
 ):
     """Return study overview. Optionally filter by event-centered window."""
+    if not anchor_event_id and study_id != "iran":
+        return Response(content=_overview_json(study_id, _today_iso()), media_type="application/json")
     result = {**OVERVIEW_STUB, "study_id": study_id}
     result["time_range"] = ["2021-01-15", _today_iso()]
     if anchor_event_id:
@@ -1017,31 +1133,113 @@ def get_overview(
     return result
 
 
+# Live Wayback responses (process cache + optional Redis); empty CDX results change rarely, so keep them longer
+WAYBACK_RESPONSE_TTL_S = 900
+WAYBACK_EMPTY_TTL_S = 3600
+# Keys come from client query strings, so the process layer is bounded; one cache per TTL.
+# Only touched from the event loop, so no lock.
+_WAYBACK_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=WAYBACK_RESPONSE_TTL_S)
+_WAYBACK_EMPTY_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=WAYBACK_EMPTY_TTL_S)
+
+
+async def _redis_get(key: str) -> Optional[Any]:
+    """Decoded JSON from the shared Redis cache, or None (no REDIS_URL, miss, or Redis error)."""
+    redis = getattr(app.state, "redis", None)
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get("sm:" + key)
+    except Exception as e:
+        log.warning("redis get failed: %s", e)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def _redis_set(key: str, value: Any, ttl: float) -> None:
+    """Best-effort write to the shared Redis cache; failures only log."""
+    redis = getattr(app.state, "redis", None)
+    if redis is None:
+        return
+    try:
+        await redis.set("sm:" + key, json.dumps(value, separators=(",", ":"), default=str), ex=int(ttl))
+    except Exception as e:
+        log.warning("redis set failed: %s", e)
+
+
+# Cache misses being computed now, by cache key; concurrent identical requests share one result
+_INFLIGHT: dict[str, asyncio.Future] = {}
+
+
+async def _single_flight(key: str, make: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Await make() once per key at a time: concurrent callers with the same key share its result or
+    exception, so a cold cache costs one upstream fetch. Shielded so a disconnecting caller does not
+    cancel the work for the others.
+    """
+    fut = _INFLIGHT.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(make())
+        _INFLIGHT[key] = fut
+        fut.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return await asyncio.shield(fut)
+
+
+async def _cached_wayback(key: str, empty: Callable[[dict], bool], fetch: Callable[[], Awaitable[dict]]) -> dict:
+    """
+    Return the cached response for key, else await fetch() and cache it (errors are not cached).
+    Checks the bounded process caches, then Redis when REDIS_URL is set; Redis failures fall through to fetch.
+    """
+    hit = _WAYBACK_CACHE.get(key)
+    if hit is None:
+        hit = _WAYBACK_EMPTY_CACHE.get(key)
+    if hit is not None:
+        return hit
+    out = await _redis_get(key)
+    if out is not None:
+        _WAYBACK_CACHE[key] = out
+        return out
+
+    async def miss() -> dict:
+        out = await fetch()
+        if "error" not in out:
+            is_empty = empty(out)
+            (_WAYBACK_EMPTY_CACHE if is_empty else _WAYBACK_CACHE)[key] = out
+            await _redis_set(key, out, WAYBACK_EMPTY_TTL_S if is_empty else WAYBACK_RESPONSE_TTL_S)
+        return out
+
+    return await _single_flight(key, miss)
+
+
 @app.get("/api/wayback/snapshots")
-def wayback_snapshots(
+async def wayback_snapshots(
+    request: Request,
     url: str,
     from_year: Optional[int] = None,
     to_year: Optional[int] = None,
-    sample: int = 30,
+    sample: SampleSmall = 30,
 ):
     """Return Wayback snapshots with optional metric extraction."""
-    sample = min(max(sample, 1), 50)
-    return get_snapshots_with_metrics(
-        url=url,
-        from_year=from_year,
-        to_year=to_year,
-        sample=sample,
+    return await _cached_wayback(
+        f"wayback:snapshots:{url}|{from_year}|{to_year}|{sample}",
+        lambda out: not out["snapshots"],
+        lambda: aget_snapshots_with_metrics(
+            request.app.state.http,
+            url=url,
+            from_year=from_year,
+            to_year=to_year,
+            sample=sample,
+        ),
     )
 
 
 @app.get("/api/wayback/instagram/cached")
 def wayback_instagram_cached(username: str):
     """Return cached Instagram snapshots for a username, if any. Fast path for profiles already fetched via jobs."""
-    from jobs import get_cached_instagram_snapshots
-    cached = get_cached_instagram_snapshots(username)
-    if cached is None:
+    from jobs import get_cached_instagram_snapshots_json
+    body = get_cached_instagram_snapshots_json(username)
+    if body is None:
         raise HTTPException(status_code=404, detail="No cached data for this username")
-    return cached
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/wayback/instagram/cache-first")
@@ -1061,72 +1259,107 @@ def wayback_instagram_cache_first(
 
 
 @app.get("/api/wayback/instagram")
-def wayback_instagram(
+async def wayback_instagram(
+    request: Request,
     username: str,
     from_year: Optional[int] = None,
     to_year: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
-    sample: int = 30,
+    sample: SampleLarge = 30,
     include_evidence: bool = True,
     progress: bool = False,
+    stream: bool = Query(False, description="NDJSON: header line, then one line per snapshot as fetched"),
 ):
     """Return Wayback archival snapshots for an Instagram profile."""
-    sample = min(max(sample, 1), 100)
-    return get_instagram_archival_metrics(
-        username=username,
-        from_year=from_year,
-        to_year=to_year,
-        from_date=from_date,
-        to_date=to_date,
-        sample=sample,
-        include_evidence=include_evidence,
-        progress=progress,
+    if stream and username.strip():
+        rows = aiter_instagram_archival_metrics(
+            request.app.state.http,
+            username,
+            from_year=from_year,
+            to_year=to_year,
+            from_date=from_date,
+            to_date=to_date,
+            sample=sample,
+            include_evidence=include_evidence,
+        )
+        return StreamingResponse(
+            (json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n" async for row in rows),
+            media_type="application/x-ndjson",
+        )
+    return await _cached_wayback(
+        f"wayback:instagram:{username}|{from_year}|{to_year}|{from_date}|{to_date}|{sample}|{include_evidence}|{progress}",
+        lambda out: not out["snapshots_total"],
+        lambda: aget_instagram_archival_metrics(
+            request.app.state.http,
+            username=username,
+            from_year=from_year,
+            to_year=to_year,
+            from_date=from_date,
+            to_date=to_date,
+            sample=sample,
+            include_evidence=include_evidence,
+            progress=progress,
+        ),
     )
 
 
 @app.get("/api/wayback/instagram/debug")
-def wayback_instagram_debug(
+async def wayback_instagram_debug(
+    request: Request,
     username: str,
     from_year: Optional[int] = 2012,
     to_year: Optional[int] = 2026,
 ):
     """Debug: show raw CDX snapshot count for a username."""
     url = f"https://www.instagram.com/{username.strip()}/"
-    try:
-        raw = list_snapshots(url, from_year=from_year, to_year=to_year, limit=500)
-        deduped = deduplicate_snapshots(raw)
-        sampled = evenly_sample_snapshots(deduped, 24)
-        return {
-            "username": username,
-            "url": url,
-            "raw_count": len(raw),
-            "deduped_count": len(deduped),
-            "sampled_count": len(sampled),
-            "sample_preview": sampled[:5] if sampled else [],
-        }
-    except Exception as e:
-        return {"username": username, "error": str(e), "raw_count": 0}
+
+    async def fetch() -> dict:
+        try:
+            raw = await alist_snapshots(request.app.state.http, url, from_year=from_year, to_year=to_year, limit=500)
+            deduped = deduplicate_snapshots(raw)
+            sampled = evenly_sample_snapshots(deduped, 24)
+            return {
+                "username": username,
+                "url": url,
+                "raw_count": len(raw),
+                "deduped_count": len(deduped),
+                "sampled_count": len(sampled),
+                "sample_preview": sampled[:5] if sampled else [],
+            }
+        except Exception as e:
+            return {"username": username, "error": str(e), "raw_count": 0}
+
+    return await _cached_wayback(
+        f"wayback:instagram_debug:{username}|{from_year}|{to_year}",
+        lambda out: not out["raw_count"],
+        fetch,
+    )
 
 
 @app.get("/api/wayback/instagram/followers")
-def wayback_instagram_followers(
+async def wayback_instagram_followers(
+    request: Request,
     username: str,
     from_year: Optional[int] = None,
     to_year: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
-    sample: int = 30,
+    sample: SampleLarge = 30,
 ):
     """Return follower count time series from Wayback snapshots."""
-    sample = min(max(sample, 1), 100)
-    return get_instagram_followers_time_series(
-        username=username,
-        from_year=from_year,
-        to_year=to_year,
-        from_date=from_date,
-        to_date=to_date,
-        sample=sample,
+    return await _cached_wayback(
+        f"wayback:instagram_followers:{username}|{from_year}|{to_year}|{from_date}|{to_date}|{sample}",
+        lambda out: not out["points"],
+        lambda: aget_instagram_followers_time_series(
+            request.app.state.http,
+            username=username,
+            from_year=from_year,
+            to_year=to_year,
+            from_date=from_date,
+            to_date=to_date,
+            sample=sample,
+        ),
     )
 
 
@@ -1187,10 +1420,9 @@ def wayback_youtube(
     to_year: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
-    sample: int = 40,
+    sample: SampleLarge = 40,
 ):
     """Return YouTube channel subscriber counts from Wayback archival snapshots."""
-    sample = min(max(sample, 1), 100)
     return get_youtube_archival_metrics(
         input_str=input_param,
         from_year=from_year if from_year is not None else 2005,
@@ -1201,39 +1433,35 @@ def wayback_youtube(
     )
 
 
-def _require_db():
-    if not os.getenv("DATABASE_URL"):
+async def _require_db():
+    """Dependency for job endpoints: 503 unless DATABASE_URL is configured (async: no threadpool hop)."""
+    if not _DB_CONFIGURED:
         raise HTTPException(
             status_code=503,
             detail="Database not configured. Set DATABASE_URL for job support.",
         )
 
 
-class CreateInstagramJobBody(BaseModel):
-    username: str
+class _WaybackJobBody(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     from_year: Optional[int] = None
     to_year: Optional[int] = None
     from_date: Optional[str] = None
     to_date: Optional[str] = None
-    sample: int = 30
+    sample: SampleLarge = 30
 
 
-class CreateYouTubeJobBody(BaseModel):
+class CreateInstagramJobBody(_WaybackJobBody):
+    username: str
+
+
+class CreateYouTubeJobBody(_WaybackJobBody):
     input: str
-    from_year: Optional[int] = None
-    to_year: Optional[int] = None
-    from_date: Optional[str] = None
-    to_date: Optional[str] = None
-    sample: int = 30
 
 
-class CreateTwitterJobBody(BaseModel):
+class CreateTwitterJobBody(_WaybackJobBody):
     username: str
-    from_year: Optional[int] = None
-    to_year: Optional[int] = None
-    from_date: Optional[str] = None
-    to_date: Optional[str] = None
-    sample: int = 30
 
 
 @app.get("/api/wayback/twitter/cache-first")
@@ -1259,14 +1487,13 @@ def wayback_twitter(
     to_year: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
-    sample: int = 40,
+    sample: SampleLarge = 40,
 ):
     """
     Return Twitter/X profile follower counts from Wayback archival snapshots.
     GET /api/wayback/twitter?username=jack&sample=20
     GET /api/wayback/twitter?username=@nytimes&sample=20
     """
-    sample = min(max(sample, 1), 100)
     return get_twitter_archival_metrics(
         username=username,
         from_year=from_year if from_year is not None else 2009,
@@ -1277,10 +1504,9 @@ def wayback_twitter(
     )
 
 
-@app.post("/api/wayback/twitter/jobs")
-def create_wayback_twitter_job(body: CreateTwitterJobBody, background_tasks: BackgroundTasks):
+@app.post("/api/wayback/twitter/jobs", dependencies=[Depends(_require_db)])
+def create_wayback_twitter_job(body: CreateTwitterJobBody):
     """Start a Wayback Twitter fetch job. Returns immediately with job_id."""
-    _require_db()
     job_id = create_twitter_job(
         username=body.username,
         from_year=body.from_year,
@@ -1289,14 +1515,13 @@ def create_wayback_twitter_job(body: CreateTwitterJobBody, background_tasks: Bac
         to_date=body.to_date,
         sample=body.sample,
     )
-    background_tasks.add_task(_run_twitter_job, job_id)
+    submit_job(_run_twitter_job, job_id)
     return {"job_id": job_id, "status": "queued"}
 
 
-@app.post("/api/wayback/youtube/jobs")
-def create_wayback_youtube_job(body: CreateYouTubeJobBody, background_tasks: BackgroundTasks):
+@app.post("/api/wayback/youtube/jobs", dependencies=[Depends(_require_db)])
+def create_wayback_youtube_job(body: CreateYouTubeJobBody):
     """Start a Wayback YouTube fetch job. Returns immediately with job_id."""
-    _require_db()
     job_id = create_youtube_job(
         input_str=body.input,
         from_year=body.from_year,
@@ -1305,14 +1530,13 @@ def create_wayback_youtube_job(body: CreateYouTubeJobBody, background_tasks: Bac
         to_date=body.to_date,
         sample=body.sample,
     )
-    background_tasks.add_task(_run_youtube_job, job_id)
+    submit_job(_run_youtube_job, job_id)
     return {"job_id": job_id, "status": "queued"}
 
 
-@app.post("/api/wayback/instagram/jobs")
-def create_wayback_instagram_job(body: CreateInstagramJobBody, background_tasks: BackgroundTasks):
+@app.post("/api/wayback/instagram/jobs", dependencies=[Depends(_require_db)])
+def create_wayback_instagram_job(body: CreateInstagramJobBody):
     """Start a Wayback Instagram fetch job. Returns immediately with job_id."""
-    _require_db()
     job_id = create_instagram_job(
         username=body.username,
         from_year=body.from_year,
@@ -1321,66 +1545,68 @@ def create_wayback_instagram_job(body: CreateInstagramJobBody, background_tasks:
         to_date=body.to_date,
         sample=body.sample,
     )
-    background_tasks.add_task(_run_instagram_job, job_id)
+    submit_job(_run_instagram_job, job_id)
     return {"job_id": job_id, "status": "queued"}
 
 
-@app.get("/api/wayback/jobs/list")
+@app.get("/api/wayback/jobs/list", dependencies=[Depends(_require_db)])
 def list_wayback_jobs(
     username: Optional[str] = None,
     platform: Optional[str] = None,
     limit: int = 10,
 ):
     """List recent jobs, optionally filtered by username."""
-    if not os.getenv("DATABASE_URL"):
-        raise HTTPException(
-            status_code=503,
-            detail="Database not configured. Set DATABASE_URL for job support.",
-        )
     try:
-        jobs = list_jobs(username=username, platform=platform, limit=limit)
+        jobs = DB_BREAKER.call(list_jobs, username=username, platform=platform, limit=limit)
         return {"jobs": jobs}
-    except Exception:
+    except (CircuitOpenError, *DB_UNAVAILABLE_ERRORS):
         raise HTTPException(
             status_code=503,
             detail="Database temporarily unavailable.",
         )
 
 
-@app.get("/api/wayback/jobs/{job_id}")
+@app.get("/api/wayback/jobs/{job_id}", dependencies=[Depends(_require_db)])
 def get_wayback_job(job_id: str):
     """Get job status and results when completed."""
-    _require_db()
     job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
 
-@app.get("/api/wayback/jobs/{job_id}/results")
+@app.get("/api/wayback/jobs/{job_id}/results", dependencies=[Depends(_require_db)])
 def get_wayback_job_results(job_id: str):
     """Get job results (snapshots)."""
-    _require_db()
-    job = get_job(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
     results = get_job_results(job_id)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Job not found")
     return {"job_id": job_id, "results": results}
 
 
-@app.post("/api/wayback/jobs/{job_id}/cancel")
+@app.get("/api/wayback/jobs/{job_id}/results.ndjson", dependencies=[Depends(_require_db)])
+def stream_wayback_job_results(job_id: str):
+    """Job results as NDJSON, one snapshot per line, streamed from the database."""
+    rows = iter_job_results(job_id)
+    if rows is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        (json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n" for row in rows),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post("/api/wayback/jobs/{job_id}/cancel", dependencies=[Depends(_require_db)])
 def cancel_wayback_job(job_id: str):
     """Cancel a queued or running job."""
-    _require_db()
     if not cancel_job(job_id):
         raise HTTPException(status_code=400, detail="Job not found or not cancelable")
     return {"job_id": job_id, "status": "canceled"}
 
 
-@app.delete("/api/wayback/jobs/{job_id}")
+@app.delete("/api/wayback/jobs/{job_id}", dependencies=[Depends(_require_db)])
 def delete_wayback_job(job_id: str):
     """Delete job and its results."""
-    _require_db()
     if not delete_job(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
     return {"job_id": job_id, "status": "deleted"}
@@ -2188,7 +2414,7 @@ def youtube_comments_wordcloud(
         _normalize_handle_for_fallback,
     )
     # Sample channel: serve from memory when DB not configured or has no rows
-    if cid == SAMPLE_CHANNEL_ID and not os.getenv("DATABASE_URL"):
+    if cid == SAMPLE_CHANNEL_ID and not _DB_CONFIGURED:
         data = get_wordcloud_data_from_texts(
             SAMPLE_COMMENTS_FALLBACK,
             window_start=window_start.strip(),
@@ -2198,7 +2424,7 @@ def youtube_comments_wordcloud(
         )
         return data
     # Bplus Podcast by handle: serve from memory when DB not configured
-    if _normalize_handle_for_fallback(cid) == BPLUS_HANDLE_NORMALIZED and not os.getenv("DATABASE_URL"):
+    if _normalize_handle_for_fallback(cid) == BPLUS_HANDLE_NORMALIZED and not _DB_CONFIGURED:
         data = get_wordcloud_data_from_texts(
             BPLUS_SAMPLE_COMMENTS,
             window_start=window_start.strip(),
@@ -2207,7 +2433,7 @@ def youtube_comments_wordcloud(
             channel_terms=terms,
         )
         return data
-    if not os.getenv("DATABASE_URL"):
+    if not _DB_CONFIGURED:
         raise HTTPException(status_code=503, detail="Database not configured.")
     try:
         with cursor() as cur:
@@ -2238,7 +2464,7 @@ def youtube_comments_sentiment(
     Returns aggregate: count, avg_polarity, positive_pct, neutral_pct, negative_pct.
     English-oriented; other languages may score neutral.
     """
-    if not os.getenv("DATABASE_URL"):
+    if not _DB_CONFIGURED:
         raise HTTPException(status_code=503, detail="Database not configured.")
     try:
         from signalmap.services.comment_sentiment import get_sentiment_for_video
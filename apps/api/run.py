@@ -2,5 +2,11 @@
 import os
 import uvicorn
 
-port = int(os.environ.get("PORT", "8080"))
-uvicorn.run("main:app", host="0.0.0.0", port=port)
+# Guarded: spawn/forkserver children (uvicorn workers, the jobs parse pool) re-import this file
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", "8080"))
+    # Worker processes; each keeps its own caches and DB pool (Redis, when set, is shared). Default 1
+    # since the ML-backed services are memory-heavy; raise WEB_CONCURRENCY on larger instances.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    # uvloop + httptools ship with uvicorn[standard]; pin them rather than relying on "auto" detection
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers, loop="uvloop", http="httptools")
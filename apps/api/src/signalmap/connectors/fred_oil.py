@@ -1,38 +1,89 @@
 """Fetch Brent crude oil price from FRED (DCOILBRENTEU)."""
 
+import atexit
 import csv
 import io
+import json
+import logging
+import os
 import re
+import threading
 import time
-from typing import Optional
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple, Optional
 
 import httpx
 
+try:
+    import redis
+except ImportError:  # optional: without it each process keeps its own cache
+    redis = None
+
+log = logging.getLogger(__name__)
+
 FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv?id=DCOILBRENTEU"
 FRED_TXT_URL = "https://fred.stlouisfed.org/data/DCOILBRENTEU.txt"
 CACHE_TTL_SEC = 6 * 60 * 60  # 6 hours
-_cache: Optional[tuple[list[dict], float]] = None
+# (points sorted by date, their dates as a parallel list for bisect, fetched_at)
+_cache: Optional[tuple[list["BrentPoint"], list[str], float]] = None
+_REFRESH_LOCK = threading.Lock()
+# Shared cache across workers/replicas when REDIS_URL is set; the lock key lets one process refetch
+REDIS_KEY = "fred:DCOILBRENTEU"
+REDIS_LOCK_TTL_SEC = 30
+REDIS_WAIT_SEC = 10.0
+_redis_client = None
+# One keep-alive client per process (thread-safe); the CSV -> TXT fallback and later refreshes reuse it
+_CLIENT = httpx.Client(
+    timeout=15.0,
+    limits=httpx.Limits(max_keepalive_connections=4),
+    headers={"User-Agent": "SignalMap/1.0"},
+)
+atexit.register(_CLIENT.close)
 _DATA_LINE = re.compile(r"^[|]?(\d{4}-\d{2}-\d{2})\s*[|]\s*([^|]+)")
 
 
-def _parse_csv(text: str) -> list[dict]:
+class BrentPoint(NamedTuple):
+    """One daily observation; a tuple is ~4x smaller than a dict across the ~10k-row cached series."""
+
+    date: str
+    value: float
+
+
+def _parse_csv(text: str) -> list[BrentPoint]:
     """Parse FRED CSV. Columns: observation_date or DATE, DCOILBRENTEU or VALUE."""
-    reader = csv.DictReader(io.StringIO(text))
+    reader = csv.reader(io.StringIO(text))
+    header = [h.strip() for h in next(reader, [])]
+    # Resolve column positions once instead of per-row dict lookups
+    date_i = _column(header, "observation_date", "DATE")
+    val_i = _column(header, "DCOILBRENTEU", "VALUE")
+    if date_i is None or val_i is None:
+        return []
+    width = max(date_i, val_i) + 1
     rows = []
     for row in reader:
-        date = (row.get("observation_date") or row.get("DATE") or "").strip()
-        val = (row.get("DCOILBRENTEU") or row.get("VALUE") or "").strip()
+        if len(row) < width:
+            continue
+        date = row[date_i].strip()
+        val = row[val_i].strip()
         if not date or not val or val == ".":
             continue
         try:
             v = float(val)
         except ValueError:
             continue
-        rows.append({"date": date, "value": round(v, 2)})
+        rows.append(BrentPoint(date, round(v, 2)))
     return rows
 
 
-def _parse_txt(text: str) -> list[dict]:
+def _column(header: list[str], *names: str) -> Optional[int]:
+    """Index of the first of names present in header."""
+    for name in names:
+        if name in header:
+            return header.index(name)
+    return None
+
+
+def _parse_txt(text: str) -> list[BrentPoint]:
     """Parse FRED data txt. Format: DATE|VALUE (skip metadata and # lines)."""
     rows = []
     for line in text.splitlines():
@@ -49,36 +100,82 @@ def _parse_txt(text: str) -> list[dict]:
             v = float(val)
         except ValueError:
             continue
-        rows.append({"date": date, "value": round(v, 2)})
+        rows.append(BrentPoint(date, round(v, 2)))
     return rows
 
 
-def _fetch_raw() -> list[dict]:
+def _fetch_raw() -> list[BrentPoint]:
     """Fetch and parse FRED. Tries CSV first, then TXT fallback."""
-    with httpx.Client(timeout=15.0) as client:
-        try:
-            r = client.get(FRED_CSV_URL)
-            r.raise_for_status()
-            parsed = _parse_csv(r.text)
-        except Exception:
-            r = client.get(FRED_TXT_URL)
-            r.raise_for_status()
-            parsed = _parse_txt(r.text)
+    try:
+        r = _CLIENT.get(FRED_CSV_URL)
+        r.raise_for_status()
+        parsed = _parse_csv(r.text)
+    except Exception:
+        r = _CLIENT.get(FRED_TXT_URL)
+        r.raise_for_status()
+        parsed = _parse_txt(r.text)
     if not parsed:
         raise ValueError("No valid data from FRED")
     return parsed
 
 
+def _redis():
+    """Process-wide Redis client, or None when REDIS_URL/redis is missing."""
+    global _redis_client
+    if _redis_client is None and redis is not None and os.getenv("REDIS_URL"):
+        _redis_client = redis.Redis.from_url(os.environ["REDIS_URL"], socket_timeout=2.0)
+    return _redis_client
+
+
+def _redis_points(r) -> Optional[list[BrentPoint]]:
+    try:
+        blob = r.get(REDIS_KEY)
+    except Exception as e:
+        log.warning("fred redis get failed: %s", e)
+        return None
+    return [BrentPoint(*p) for p in json.loads(blob)] if blob else None
+
+
+def _load_points() -> list[BrentPoint]:
+    """
+    Shared Redis copy if present; otherwise fetch FRED and publish it. Only the process that wins the
+    SET NX lock fetches; others poll Redis briefly for its result before fetching themselves.
+    """
+    r = _redis()
+    if r is None:
+        return _fetch_raw()
+    points = _redis_points(r)
+    if points:
+        return points
+    try:
+        leader = r.set(REDIS_KEY + ":lock", "1", nx=True, ex=REDIS_LOCK_TTL_SEC)
+    except Exception as e:
+        log.warning("fred redis lock failed: %s", e)
+        return _fetch_raw()
+    if not leader:
+        deadline = time.monotonic() + REDIS_WAIT_SEC
+        while time.monotonic() < deadline:
+            time.sleep(0.25)
+            points = _redis_points(r)
+            if points:
+                return points
+    points = _fetch_raw()
+    try:
+        r.set(REDIS_KEY, json.dumps(points, separators=(",", ":")), ex=CACHE_TTL_SEC)
+        r.delete(REDIS_KEY + ":lock")
+    except Exception as e:
+        log.warning("fred redis set failed: %s", e)
+    return points
+
+
 def get_brent_oil(start: str, end: str) -> list[dict]:
-    """Return Brent oil points in [start, end]. Cached 6h."""
+    """Return Brent oil points in [start, end]. Cached 6h (in process, and in Redis when configured)."""
     global _cache
-    now = time.time()
-    if _cache is None or (now - _cache[1]) > CACHE_TTL_SEC:
-        try:
-            raw = _fetch_raw()
-            _cache = (raw, now)
-        except Exception:
-            raise
-    points = _cache[0]
-    filtered = [p for p in points if start <= p["date"] <= end]
-    return filtered
+    if _cache is None or (time.time() - _cache[2]) > CACHE_TTL_SEC:
+        with _REFRESH_LOCK:  # one refresh per process; other threads reuse its result
+            if _cache is None or (time.time() - _cache[2]) > CACHE_TTL_SEC:
+                raw = sorted(_load_points())
+                _cache = (raw, [p.date for p in raw], time.time())
+    points, dates, _ = _cache
+    # ISO dates sort lexically, so the range is a slice: O(log n) instead of a full scan
+    return [p._asdict() for p in points[bisect_left(dates, start):bisect_right(dates, end)]]
@@ -7,7 +7,10 @@ Conservative extraction: false positives worse than missing.
 import logging
 import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 import httpx
@@ -17,11 +20,29 @@ FETCH_TIMEOUT = 15.0
 # Internet Archive: 15 req/min limit (archive.org/details/toomanyrequests_20191110)
 REQUEST_DELAY_MS = (4500, 5500)  # ~11–13 req/min
 EVIDENCE_MAX_LEN = 140
+CDX_CONCURRENCY = 3  # alternate CDX variant queries in flight per list_snapshots call
+CDX_MIN_GAP_S = 0.5  # minimum spacing between CDX request starts, across threads
+_last_cdx_request = 0.0
+_cdx_lock = threading.Lock()
 
 WAYBACK_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; SignalMap/1.0; research tool)",
 }
 
+# meta description / og:description content, with name/property before or after content
+_META_DESCRIPTION_PATTERNS = (
+    re.compile(
+        r'<meta[^>]+(?:name|property)=["\'](?:description|og:description)["\'][^>]+content=["\']([^"\']+)["\']',
+        re.I,
+    ),
+    re.compile(
+        r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+(?:name|property)=["\'](?:description|og:description)["\']',
+        re.I,
+    ),
+)
+_SUBSCRIBERS_RE = re.compile(r"([0-9][0-9,\.]*)\s*([KM])?\s*subscribers", re.I)
+_SUBSCRIBERS_REV_RE = re.compile(r"subscribers\s*[^0-9]{0,50}?([0-9][0-9,\.]*)\s*([KM])?", re.I)
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +51,12 @@ def canonicalize_youtube_input(input_str: str) -> dict:
     Accept either full URL or bare handle.
     Returns {"kind": str, "canonical_url": str}.
     """
-    s = input_str.strip()
+    # Memoized on the stripped input; copy so callers can't mutate the cached dict
+    return dict(_canonicalize_youtube_input(input_str.strip()))
+
+
+@lru_cache(maxsize=4096)
+def _canonicalize_youtube_input(s: str) -> dict:
     if not s:
         return {"kind": "url", "canonical_url": ""}
 
@@ -70,6 +96,16 @@ def canonicalize_youtube_input(input_str: str) -> dict:
     return {"kind": "url", "canonical_url": s if s.startswith("https://") else f"https://{s}"}
 
 
+def _throttle_cdx() -> None:
+    """Sleep only for what is left of CDX_MIN_GAP_S since the previous CDX request started."""
+    global _last_cdx_request
+    with _cdx_lock:
+        wait = _last_cdx_request + CDX_MIN_GAP_S - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_cdx_request = time.monotonic()
+
+
 def _fetch_cdx(
     url: str,
     from_year: Optional[int] = None,
@@ -100,7 +136,7 @@ def _fetch_cdx(
     elif to_year is not None:
         params_list.append(("to", str(to_year)))
 
-    time.sleep(0.5)
+    _throttle_cdx()
     try:
         with httpx.Client(timeout=15.0, headers=WAYBACK_HEADERS) as client:
             resp = client.get(CDX_URL, params=params_list)
@@ -110,7 +146,7 @@ def _fetch_cdx(
             resp.raise_for_status()
             data = resp.json()
     except Exception as e:
-        logger.warning("CDX fetch failed for %s: %s", url[:60], e)
+        logger.warning("CDX fetch failed for %.60s: %s", url, e)
         return []
 
     if not data or len(data) < 2:
@@ -173,10 +209,9 @@ def list_snapshots(
                 (f"http://www.youtube.com:80/user/{handle}", "prefix"),
             ])
 
-    for item in urls_to_try:
-        url = item[0] if isinstance(item, tuple) else item
-        match_type = item[1] if isinstance(item, tuple) and len(item) > 1 else None
-        snaps = _fetch_cdx(
+    def fetch(item: tuple[str, Optional[str]]) -> list[dict]:
+        url, match_type = item
+        return _fetch_cdx(
             url,
             from_year=from_year,
             to_year=to_year,
@@ -185,44 +220,67 @@ def list_snapshots(
             limit=limit,
             match_type=match_type,
         )
-        for s in snaps:
-            if s["timestamp"] not in seen_ts:
-                seen_ts.add(s["timestamp"])
-                all_snapshots.append(s)
-        if all_snapshots:
-            break
+
+    # The first variant with any snapshots wins. Ask the canonical URL alone first (it usually
+    # answers); if it is empty, query the alternates CDX_CONCURRENCY at a time and take the first
+    # non-empty in order, so at most CDX_CONCURRENCY - 1 queries past the winner are spent.
+    snaps = fetch(urls_to_try[0])
+    alternates = urls_to_try[1:]
+    if not snaps and alternates:
+        with ThreadPoolExecutor(max_workers=CDX_CONCURRENCY) as pool:
+            for i in range(0, len(alternates), CDX_CONCURRENCY):
+                snaps = next((r for r in pool.map(fetch, alternates[i : i + CDX_CONCURRENCY]) if r), [])
+                if snaps:
+                    break
+
+    for s in snaps:
+        if s["timestamp"] not in seen_ts:
+            seen_ts.add(s["timestamp"])
+            all_snapshots.append(s)
 
     return sorted(all_snapshots, key=lambda s: s["timestamp"])
 
 
 def evenly_sample(snapshots: list[dict], sample: int = 40) -> list[dict]:
-    """Sample evenly across the full date range."""
-    if not snapshots:
+    """
+    Sample evenly across the full date range, first and last snapshots included.
+    Expects snapshots sorted by timestamp (as list_snapshots returns them); the sample keeps that order.
+    """
+    if not snapshots or sample <= 0:
         return []
-    sorted_snaps = sorted(snapshots, key=lambda s: s["timestamp"])
-    if len(sorted_snaps) <= sample:
-        return sorted_snaps
+    n = len(snapshots)
+    if n <= sample:
+        return list(snapshots)
+    if sample == 1:
+        return snapshots[:1]
+    # Integer linspace over [0, n - 1]; n > sample keeps the indices distinct and increasing
+    return [snapshots[j * (n - 1) // (sample - 1)] for j in range(sample)]
 
-    step = max(1, len(sorted_snaps) // sample)
-    indices = [j * step for j in range(sample)][:sample]
-    result = [sorted_snaps[i] for i in indices if i < len(sorted_snaps)]
-    return sorted(result, key=lambda s: s["timestamp"])
 
+def new_client() -> httpx.Client:
+    """httpx client for snapshot fetches. Share one across a batch of fetches; close when done."""
+    return httpx.Client(timeout=FETCH_TIMEOUT, follow_redirects=True, headers=WAYBACK_HEADERS)
 
-def fetch_snapshot_html(timestamp: str, original_url: str) -> tuple[Optional[str], str]:
+
+def fetch_snapshot_html(
+    timestamp: str, original_url: str, client: Optional[httpx.Client] = None
+) -> tuple[Optional[str], str]:
     """
     Fetch HTML from archived URL.
     Returns (html_text, archived_url). html_text is None on failure.
+    Pass ``client`` (see new_client) to reuse one keep-alive connection across fetches.
     """
     archived_url = f"https://web.archive.org/web/{timestamp}/{original_url}"
+    if client is None:
+        with new_client() as own:
+            return fetch_snapshot_html(timestamp, original_url, own)
     try:
-        with httpx.Client(timeout=FETCH_TIMEOUT, follow_redirects=True, headers=WAYBACK_HEADERS) as client:
+        resp = client.get(archived_url)
+        if resp.status_code == 429:
+            time.sleep(5.0)
             resp = client.get(archived_url)
-            if resp.status_code == 429:
-                time.sleep(5.0)
-                resp = client.get(archived_url)
-            resp.raise_for_status()
-            return resp.text, archived_url
+        resp.raise_for_status()
+        return resp.text, archived_url
     except Exception:
         return None, archived_url
 
@@ -252,24 +310,10 @@ def extract_subscribers(html: str) -> dict:
         return {"value": None, "confidence": 0.0, "evidence": None}
 
     # Strategy 1: Meta tags (name/property before content, or content before name/property)
-    meta_patterns = [
-        re.compile(
-            r'<meta[^>]+(?:name|property)=["\'](?:description|og:description)["\'][^>]+content=["\']([^"\']+)["\']',
-            re.I,
-        ),
-        re.compile(
-            r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+(?:name|property)=["\'](?:description|og:description)["\']',
-            re.I,
-        ),
-    ]
-    for meta_pattern in meta_patterns:
+    for meta_pattern in _META_DESCRIPTION_PATTERNS:
         for m in meta_pattern.finditer(html):
             content = m.group(1)
-            sub_match = re.search(
-                r"([0-9][0-9,\.]*)\s*([KM])?\s*subscribers",
-                content,
-                re.I,
-            )
+            sub_match = _SUBSCRIBERS_RE.search(content)
             if sub_match:
                 raw = sub_match.group(1)
                 suffix = sub_match.group(2)
@@ -281,11 +325,7 @@ def extract_subscribers(html: str) -> dict:
                     return {"value": val, "confidence": 0.75, "evidence": snippet}
 
     # Strategy 2: Visible text fallback - "subscribers" within 50 chars of number
-    sub_pattern = re.compile(
-        r"([0-9][0-9,\.]*)\s*([KM])?\s*subscribers",
-        re.I,
-    )
-    for m in sub_pattern.finditer(html):
+    for m in _SUBSCRIBERS_RE.finditer(html):
         raw = m.group(1)
         suffix = m.group(2)
         val = _parse_subscriber_number(raw, suffix)
@@ -296,11 +336,7 @@ def extract_subscribers(html: str) -> dict:
             return {"value": val, "confidence": 0.5, "evidence": snippet}
 
     # Reverse: "subscribers" then number within 50 chars
-    rev = re.compile(
-        r"subscribers\s*[^0-9]{0,50}?([0-9][0-9,\.]*)\s*([KM])?",
-        re.I,
-    )
-    for m in rev.finditer(html):
+    for m in _SUBSCRIBERS_REV_RE.finditer(html):
         raw = m.group(1)
         suffix = m.group(2)
         val = _parse_subscriber_number(raw, suffix)
@@ -353,33 +389,34 @@ def get_youtube_archival_metrics(
     results: list[dict] = []
     parse_success = 0
 
-    for i, snap in enumerate(sampled):
-        if i > 0:
-            delay = random.uniform(
-                REQUEST_DELAY_MS[0] / 1000.0,
-                REQUEST_DELAY_MS[1] / 1000.0,
-            )
-            time.sleep(delay)
-
-        html, archived_url = fetch_snapshot_html(snap["timestamp"], snap["original"])
-        entry: dict = {
-            "timestamp": snap["timestamp"],
-            "original_url": snap["original"],
-            "archived_url": archived_url,
-            "subscribers": None,
-            "confidence": 0.0,
-            "evidence": None,
-        }
+    with new_client() as client:
+        for i, snap in enumerate(sampled):
+            if i > 0:
+                delay = random.uniform(
+                    REQUEST_DELAY_MS[0] / 1000.0,
+                    REQUEST_DELAY_MS[1] / 1000.0,
+                )
+                time.sleep(delay)
+
+            html, archived_url = fetch_snapshot_html(snap["timestamp"], snap["original"], client)
+            entry: dict = {
+                "timestamp": snap["timestamp"],
+                "original_url": snap["original"],
+                "archived_url": archived_url,
+                "subscribers": None,
+                "confidence": 0.0,
+                "evidence": None,
+            }
 
-        if html:
-            extracted = extract_subscribers(html)
-            if extracted["value"] is not None:
-                entry["subscribers"] = extracted["value"]
-                entry["confidence"] = extracted["confidence"]
-                entry["evidence"] = extracted["evidence"]
-                parse_success += 1
+            if html:
+                extracted = extract_subscribers(html)
+                if extracted["value"] is not None:
+                    entry["subscribers"] = extracted["value"]
+                    entry["confidence"] = extracted["confidence"]
+                    entry["evidence"] = extracted["evidence"]
+                    parse_success += 1
 
-        results.append(entry)
+            results.append(entry)
 
     logger.info(
         "YouTube wayback: %s snapshots fetched, %d parse success",
@@ -4,6 +4,7 @@ iran_presidents, opec_decisions, global_macro_oil (curated global oil / macro an
 """
 
 from datetime import date
+from functools import lru_cache
 
 # Israel–Iran–US conflict lives in world_core / world_1900 (``israel_iran_us_conflict``); not duplicated in iran_core.
 
@@ -165,17 +166,29 @@ _LAYER_REGISTRY = {
 
 def load_events(study_id: str) -> list[dict]:
     """Load default events for a study. Returns empty when no default layer is configured."""
+    return list(_load_events_cached(study_id))
+
+
+@lru_cache(maxsize=32)
+def _load_events_cached(study_id: str) -> tuple[dict, ...]:
+    # Event data is static per deploy (module constants + bundled JSON); callers must not mutate the dicts
     if study_id == "events_timeline":
         from signalmap.data.events_timeline import get_events_timeline_all
-        return get_events_timeline_all()
-    return []
+        return tuple(get_events_timeline_all())
+    return ()
 
 
 def get_events_by_layers(study_id: str, layer_list: list[str]) -> list[dict]:
     """Return events from requested layers. Merges and deduplicates by id."""
+    return list(_events_by_layers_cached(study_id, tuple(layer_list)))
+
+
+@lru_cache(maxsize=128)
+def _events_by_layers_cached(study_id: str, layers: tuple[str, ...]) -> tuple[dict, ...]:
+    # Keyed on the ordered layer tuple: order decides which layer wins a duplicate id
     seen: set[str] = set()
     out: list[dict] = []
-    for layer in layer_list:
+    for layer in layers:
         if layer == "none":
             continue
         events = _LAYER_REGISTRY.get(layer, [])
@@ -185,4 +198,4 @@ def get_events_by_layers(study_id: str, layer_list: list[str]) -> list[dict]:
             if ev.get("id") and ev["id"] not in seen:
                 seen.add(ev["id"])
                 out.append(ev)
-    return out
+    return tuple(out)
@@ -316,6 +316,16 @@ def _run_macro_signals_refresh() -> dict[str, Any]:
     return update_macro_signals()
 
 
+def vacuum_wayback_cache() -> dict[str, Any]:
+    """Maintenance: VACUUM (ANALYZE) wayback_snapshot_cache so cache lookups stay index-only."""
+    if not _has_db():
+        return {"rows_added": 0, "skipped": True}
+    from db import vacuum_wayback_snapshot_cache
+
+    vacuum_wayback_snapshot_cache()
+    return {"rows_added": 0}
+
+
 def run_oil_economy_brent_cron() -> dict[str, Any]:
     """Brent (FRED) only — for oil-economy-overview and other Brent consumers."""
     return update_brent_prices()
@@ -335,6 +345,7 @@ DATA_SOURCE_UPDATERS: dict[str, Callable[[], dict[str, Any]]] = {
     "oil_trade_network": update_oil_trade_network,
     "youtube_followers": update_youtube_channel_snapshots,
     "macro_signals": _run_macro_signals_refresh,
+    "wayback_cache_vacuum": vacuum_wayback_cache,
 }
 
 
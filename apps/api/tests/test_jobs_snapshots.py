@@ -0,0 +1,237 @@
+"""
+Unit tests for Wayback job helpers that do not need a database.
+Run: pytest apps/api/tests/test_jobs_snapshots.py -v
+"""
+
+from jobs import _cdx_ts_to_iso, _rows_to_snapshots
+
+
+def test_cdx_ts_to_iso():
+    assert _cdx_ts_to_iso("20160107123456") == "2016-01-07T12:34:56Z"
+    assert _cdx_ts_to_iso("20160107") == "2016-01-07Z"
+    assert _cdx_ts_to_iso("2016") == "2016"
+
+
+def test_rows_to_snapshots_followers():
+    rows = [
+        {"timestamp": "20160107123456", "followers": 406462, "archived_url": "https://web.archive.org/web/x"},
+        {"timestamp": None, "followers": None, "archived_url": None},
+    ]
+    out = [s._asdict() for s in _rows_to_snapshots(rows)]
+    assert out == [
+        {
+            "timestamp": "2016-01-07T12:34:56Z",
+            "followers": 406462,
+            "snapshot_url": "https://web.archive.org/web/x",
+            "raw": None,
+        },
+        {"timestamp": "", "followers": None, "snapshot_url": None, "raw": None},
+    ]
+
+
+def test_rows_to_snapshots_youtube_subscribers():
+    """YouTube rows expose subscribers under the normalized followers key."""
+    rows = [{"timestamp": "20200101000000", "subscribers": 1200, "followers": 5}]
+    out = _rows_to_snapshots(rows, follower_key="subscribers")
+    assert out[0].followers == 1200
+
+
+def test_cache_first_invalid_handles_need_no_db():
+    from jobs import cache_first
+
+    out = cache_first("instagram", "   ")
+    assert out["source"] == "live"
+    assert out["meta"]["notes"] == ["Invalid handle."]
+
+    out = cache_first("instagram", "@")
+    assert out["canonical_url"] == ""
+    assert out["meta"]["notes"] == ["Invalid handle."]
+
+
+def test_parse_instagram_html_matches_in_process():
+    from connectors.wayback_instagram import extract_instagram_metrics
+    from jobs import _parse_instagram_html
+
+    html = '"followed_by":{"count":406462},"follows":{"count":14},"media":{"count":164}'
+    assert _parse_instagram_html(html) == extract_instagram_metrics(html)
+
+
+def test_get_cache_rows_rejects_unknown_fields():
+    import pytest
+
+    from jobs import _get_cache_rows
+
+    with pytest.raises(ValueError):
+        _get_cache_rows("instagram", "https://www.instagram.com/x/", fields=("timestamp", "1; DROP TABLE x"))
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch):
+    import jobs
+
+    slept = []
+    monkeypatch.setattr(jobs.time, "sleep", slept.append)
+    bucket = jobs._TokenBucket(interval=10.0, burst=2)
+    for _ in range(4):
+        bucket.acquire()
+    assert len(slept) == 2
+    assert 9.9 < slept[0] <= 10.0
+    assert 19.9 < slept[1] <= 20.0
+
+
+def test_token_bucket_backs_off_on_rate_limit():
+    import jobs
+
+    bucket = jobs._TokenBucket(interval=2.0, burst=1, max_interval=5.0)
+    bucket.slow_down()
+    assert bucket.interval == 4.0
+    bucket.slow_down()
+    assert bucket.interval == 5.0
+    for _ in range(50):
+        bucket.speed_up()
+    assert bucket.interval == 2.0
+
+
+def test_circuit_breaker_opens_after_repeated_db_errors(monkeypatch):
+    import psycopg2
+    import pytest
+
+    import db
+
+    now = [100.0]
+    monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+    breaker = db.CircuitBreaker(fail_max=2, reset_timeout=30.0)
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise psycopg2.OperationalError("connection refused")
+
+    for _ in range(2):
+        with pytest.raises(psycopg2.OperationalError):
+            breaker.call(down)
+    with pytest.raises(db.CircuitOpenError):
+        breaker.call(down)
+    assert len(calls) == 2
+
+    now[0] += 31.0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.call(lambda: "ok") == "ok"
+
+
+def test_cache_rows_memo_is_bounded_and_invalidated_per_profile(monkeypatch):
+    from contextlib import contextmanager
+
+    import jobs
+
+    queries = []
+
+    class FakeCursor:
+        def execute(self, sql, params):
+            queries.append(params)
+
+        def fetchall(self):
+            return [{"timestamp": "20200101000000", "followers": 1, "last_cached_at": None}]
+
+    @contextmanager
+    def fake_cursor(conn=None):
+        yield FakeCursor()
+
+    monkeypatch.setattr(jobs, "cursor", fake_cursor)
+    monkeypatch.setattr(jobs, "_CACHE_ROWS", jobs.TTLCache(maxsize=2, ttl=60))
+    fields = ("timestamp", "followers")
+    jobs._get_cache_rows("twitter", "https://twitter.com/Jack", fields=fields)
+    jobs._get_cache_rows("twitter", "https://twitter.com/jack", fields=fields)
+    jobs._get_cache_rows("twitter", "https://twitter.com/jack", fields=fields, limit=5)
+    assert len(queries) == 2
+
+    jobs._invalidate_cache_rows("twitter", "https://twitter.com/JACK")
+    jobs._get_cache_rows("twitter", "https://twitter.com/jack", fields=fields)
+    assert len(queries) == 3
+
+    for i in range(5):
+        jobs._get_cache_rows("twitter", f"https://twitter.com/u{i}", fields=fields)
+    assert len(jobs._CACHE_ROWS) == 2
+
+
+def test_work_queued_jobs_survives_errors_and_fails_crashed_job(monkeypatch):
+    import threading
+
+    import psycopg2
+
+    import jobs
+
+    stop = threading.Event()
+    waits, failed = [], []
+    claims = iter([psycopg2.OperationalError("db restarting"), ("job-1", "crashy"), None])
+
+    def claim():
+        item = next(claims)
+        if isinstance(item, Exception):
+            raise item
+        if item is None:
+            stop.set()
+        return item
+
+    def crash(job_id):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(jobs, "claim_queued_job", claim)
+    monkeypatch.setitem(jobs._PLATFORMS, "crashy", {"run": crash})
+    monkeypatch.setattr(jobs, "_fail_claimed_job", lambda job_id, e: failed.append((job_id, str(e))))
+    monkeypatch.setattr(stop, "wait", waits.append)
+    jobs.work_queued_jobs(stop)
+
+    assert failed == [("job-1", "boom")]
+    assert waits[:2] == [jobs.JOB_POLL_INTERVAL_S, jobs.JOB_POLL_INTERVAL_S * 2]
+
+
+def test_circuit_breaker_probe_with_non_db_error_closes_circuit(monkeypatch):
+    import psycopg2
+    import pytest
+
+    import db
+
+    now = [100.0]
+    monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+    breaker = db.CircuitBreaker(fail_max=1, reset_timeout=30.0)
+
+    def down():
+        raise psycopg2.OperationalError("connection refused")
+
+    def bad_query():
+        raise ValueError("not a DB outage")
+
+    with pytest.raises(psycopg2.OperationalError):
+        breaker.call(down)
+    now[0] += 31.0
+    with pytest.raises(ValueError):
+        breaker.call(bad_query)
+    assert breaker.call(lambda: "ok") == "ok"
+
+
+def test_cancel_job_remembers_only_running_jobs(monkeypatch):
+    from contextlib import contextmanager
+
+    import jobs
+
+    statuses = {"queued-1": "queued", "running-1": "running"}
+
+    class FakeCursor:
+        rowcount = 0
+
+        def execute(self, sql, params):
+            want = "queued" if "status = 'queued'" in sql else "running"
+            self.rowcount = int(statuses.get(params[0]) == want)
+            if self.rowcount:
+                statuses[params[0]] = "canceled"
+
+    @contextmanager
+    def fake_cursor(conn=None):
+        yield FakeCursor()
+
+    monkeypatch.setattr(jobs, "cursor", fake_cursor)
+    monkeypatch.setattr(jobs, "_CANCELED_JOBS", jobs.TTLCache(maxsize=8, ttl=60))
+    assert jobs.cancel_job("queued-1")
+    assert jobs.cancel_job("running-1")
+    assert not jobs.cancel_job("running-1")
+    assert list(jobs._CANCELED_JOBS) == ["running-1"]
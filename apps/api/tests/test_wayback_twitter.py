@@ -0,0 +1,65 @@
+"""
+Offline tests for the Wayback Twitter/X connector helpers (no network).
+Run: pytest apps/api/tests/test_wayback_twitter.py -v
+"""
+
+import sys
+from pathlib import Path
+
+_API_DIR = Path(__file__).resolve().parent.parent
+_SRC = _API_DIR / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from signalmap.connectors.wayback_twitter import normalize_username
+
+
+def test_normalize_username_urls():
+    """twitter.com and x.com URLs (www., mobile., port, #!/, query junk) all map to the handle."""
+    expected = ("jack", "https://twitter.com/jack")
+    assert normalize_username("https://twitter.com/jack") == expected
+    assert normalize_username("twitter.com/jack/") == expected
+    assert normalize_username("https://twitter.com:80/jack") == expected
+    assert normalize_username("https://mobile.twitter.com/#!/jack") == expected
+    assert normalize_username("x.com/jack/status/1?s=20") == expected
+    assert normalize_username("twitter.com/") == ("", "")
+    assert normalize_username("netflix.com/jack") == ("", "")
+
+
+def test_normalize_username_handles():
+    expected = ("jack", "https://twitter.com/jack")
+    assert normalize_username("jack") == expected
+    assert normalize_username("  @jack ") == expected
+    assert normalize_username("@") == ("", "")
+    assert normalize_username("") == ("", "")
+
+
+def test_evenly_sample_spans_whole_timeline():
+    from signalmap.connectors.wayback_twitter import evenly_sample
+
+    snaps = [{"timestamp": f"{2000 + i}0101000000"} for i in range(25)]
+    out = evenly_sample(snaps, sample=10)
+    stamps = [s["timestamp"] for s in out]
+    assert len(out) == 10
+    assert stamps == sorted(set(stamps))
+    assert stamps[0] == "20000101000000"
+    assert stamps[-1] == "20240101000000"
+    assert evenly_sample(snaps[:3], sample=10) == snaps[:3]
+
+
+def test_is_profile_url_accepts_port_and_rejects_subpages():
+    from signalmap.connectors.wayback_twitter import _is_profile_url
+
+    assert _is_profile_url("http://twitter.com:80/jack", "jack")
+    assert _is_profile_url("https://x.com/Jack/?lang=en", "jack")
+    assert not _is_profile_url("https://twitter.com/jack/status/1", "jack")
+    assert not _is_profile_url("http://twitter.com/jackson", "jack")
+    assert not _is_profile_url("http://twitter.com/", "jack")
+
+
+def test_extract_followers_accepts_unicode_separators():
+    from signalmap.connectors.wayback_twitter import extract_followers
+
+    for sep in ("\xa0", "\u202f", "\u2009"):
+        assert extract_followers(f"<p>1,234{sep}Followers</p>")["value"] == 1234
+        assert extract_followers(f"<p>850{sep}K{sep}followers</p>")["value"] == 850_000